@@ -0,0 +1,283 @@
+# benchmarks/run.py
+import argparse
+import asyncio
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from fastmcp import FastMCP
+from crawlers import fox_crawler, reuters_crawler
+from crawlers.base_crawler import parse_article_job
+from tools.analysis import register_analysis_tools
+from utils.keywords import article_text, keyword_index
+from utils.parsing import PARSER, make_soup
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(BENCHMARK_DIR, "fixtures")
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baseline.json")
+
+CRAWLERS = {"fox": fox_crawler, "reuters": reuters_crawler}
+
+# 소스별 본문 단락 선택자 (_process_paragraph 측정용)
+PARAGRAPH_SELECTORS = {
+    "fox": "div.article-body > p",
+    "reuters": "div[data-testid='ArticleBody'] div[data-testid^='paragraph-']"
+}
+
+def load_fixtures():
+    """기록된 검색 JSON과 기사 HTML 목록 읽기 (prefix: 스트리밍 읽기가 파서에 넘기는 앞부분)"""
+    with open(os.path.join(FIXTURES_DIR, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    
+    articles = []
+    for entry in manifest["articles"]:
+        with open(os.path.join(FIXTURES_DIR, entry["file"]), "rb") as f:
+            html = f.read()
+        articles.append(dict(entry, html=html, prefix=CRAWLERS[entry["source"]].streamed_prefix(html)))
+    
+    searches = []
+    for entry in manifest["searches"]:
+        with open(os.path.join(FIXTURES_DIR, entry["file"]), encoding="utf-8") as f:
+            searches.append(dict(entry, data=json.load(f)))
+    
+    return articles, searches
+
+def parse_fixture(fixture, full=False):
+    """fetch_article_details가 다운로드 후 워커에서 실행하는 파싱 작업과 동일 (full이면 전체 페이지)"""
+    crawler = CRAWLERS[fixture["source"]]
+    html = fixture["html"] if full else fixture["prefix"]
+    return parse_article_job(type(crawler), html, "utf-8", fixture["url"])
+
+def verify_fixtures(articles):
+    """
+    스트리밍으로 읽은 앞부분이 전체 페이지와 같은 결과를 내는지 확인 (문제 목록 반환)
+    
+    페이지 상태 스크립트가 있는 Reuters 기사는 앞부분만으로 JSON 경로가 사용되어야 하고,
+    JSON 경로와 DOM 경로의 결과가 같아야 함
+    """
+    problems = []
+    for fixture in articles:
+        crawler = CRAWLERS[fixture["source"]]
+        prefix = fixture["prefix"]
+        
+        if parse_fixture(fixture) != parse_fixture(fixture, full=True):
+            problems.append(f"{fixture['file']}: 스트리밍 앞부분({len(prefix)}/{len(fixture['html'])}바이트)의 파싱 결과가 전체 페이지와 다름")
+        
+        if b"Fusion.globalContent" not in fixture["html"]:
+            continue
+        text = prefix.decode("utf-8")
+        page_state = crawler._parse_page_state(text, fixture["url"])
+        if page_state is None:
+            problems.append(f"{fixture['file']}: 스트리밍 앞부분에서 페이지 상태 JSON을 추출하지 못함")
+        elif page_state != crawler._parse_dom(text, fixture["url"]):
+            problems.append(f"{fixture['file']}: 페이지 상태 JSON과 DOM의 추출 결과가 다름")
+    return problems
+
+def time_batch(func, number):
+    """func를 number번 실행한 평균 시간 (timeit처럼 측정 중에는 GC 중지)"""
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        return (time.perf_counter() - start) / number
+    finally:
+        gc.enable()
+
+def measure(func, repeat, docs=1, size=0, min_sample=0.01):
+    """
+    실행 시간(중앙값, 최솟값), 처리량, 최대 메모리 사용량 측정
+    
+    짧은 항목은 한 표본이 min_sample초 이상이 되도록 여러 번 묶어 실행해 타이머 오차를 줄임
+    """
+    func()  # 준비 실행
+    gc.collect()
+    
+    number = 1
+    while time_batch(func, number) * number < min_sample:
+        number *= 2
+    
+    times = [time_batch(func, number) for _ in range(repeat)]
+    
+    # 메모리 추적은 실행 시간을 늘리므로 따로 한 번 실행
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    median = statistics.median(times)
+    return {
+        "median_ms": round(median * 1000, 4),
+        "min_ms": round(min(times) * 1000, 4),
+        "docs_per_sec": round(docs / median, 1),
+        "mb_per_sec": round(size / median / 1e6, 2) if size else None,
+        "peak_kb": round(peak / 1024, 1)
+    }
+
+def build_cases(articles, searches):
+    """(이름, 실행 함수, 문서 수, 바이트 수) 목록"""
+    loop = asyncio.new_event_loop()
+    
+    # 등록된 도구 함수를 그대로 측정 (MCP 전송 계층 제외)
+    mcp = FastMCP(name="News Crawler Benchmark")
+    register_analysis_tools(mcp)
+    extract_keywords = loop.run_until_complete(mcp.get_tool("extract_keywords")).fn
+    analyze_article = loop.run_until_complete(mcp.get_tool("analyze_article")).fn
+    
+    parsed = [parse_fixture(fixture) for fixture in articles]
+    texts = [article_text(article) for article in parsed]
+    
+    # 실행 중인 서버처럼 문서 빈도 색인에 코퍼스를 반영
+    keyword_index.add_articles(parsed)
+    
+    paragraphs = []
+    for fixture in articles:
+        soup = make_soup(fixture["prefix"].decode("utf-8"))
+        paragraphs.append(soup.select(PARAGRAPH_SELECTORS[fixture["source"]]))
+    
+    cases = []
+    total_size = sum(len(fixture["prefix"]) for fixture in articles)
+    
+    for search in searches:
+        crawler = CRAWLERS[search["source"]]
+        cases.append((
+            f"parse_search_page[{search['file']}]",
+            lambda crawler=crawler, data=search["data"]: crawler._parse_search_page(data), 1, 0
+        ))
+    
+    for fixture in articles:
+        cases.append((
+            f"parse_article[{fixture['file']}]",
+            lambda fixture=fixture: parse_fixture(fixture), 1, len(fixture["prefix"])
+        ))
+    cases.append((
+        "parse_article[bulk]",
+        lambda: [parse_fixture(fixture) for fixture in articles], len(articles), total_size
+    ))
+    
+    for fixture, elements in zip(articles, paragraphs):
+        crawler = CRAWLERS[fixture["source"]]
+        cases.append((
+            f"process_paragraph[{fixture['file']}]",
+            lambda crawler=crawler, elements=elements: [crawler._process_paragraph(e) for e in elements], 1, 0
+        ))
+    cases.append((
+        "process_paragraph[bulk]",
+        lambda: [
+            CRAWLERS[fixture["source"]]._process_paragraph(e)
+            for fixture, elements in zip(articles, paragraphs) for e in elements
+        ],
+        len(articles), 0
+    ))
+    
+    for fixture, text in zip(articles, texts):
+        cases.append((
+            f"extract_keywords[{fixture['file']}]",
+            lambda text=text: loop.run_until_complete(extract_keywords(text, 10)), 1, len(text)
+        ))
+    cases.append((
+        "extract_keywords[bulk]",
+        lambda: [loop.run_until_complete(extract_keywords(text, 10)) for text in texts],
+        len(texts), sum(len(text) for text in texts)
+    ))
+    
+    for fixture, article in zip(articles, parsed):
+        cases.append((
+            f"analyze_article[{fixture['file']}]",
+            lambda article=article: loop.run_until_complete(analyze_article(article)), 1, 0
+        ))
+    cases.append((
+        "analyze_article[bulk]",
+        lambda: [loop.run_until_complete(analyze_article(article)) for article in parsed],
+        len(parsed), 0
+    ))
+    
+    return cases
+
+def compare(results, baseline, tolerance, memory_tolerance):
+    """
+    기준 결과보다 허용 범위 이상 느려지거나 메모리를 더 쓴 항목 목록
+    
+    실행 시간은 다른 프로세스의 영향을 덜 받는 최솟값으로 비교
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        
+        if result["min_ms"] > base["min_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: {base['min_ms']:.3f}ms → {result['min_ms']:.3f}ms")
+        if result["peak_kb"] > base["peak_kb"] * (1 + memory_tolerance):
+            regressions.append(f"{name}: 최대 메모리 {base['peak_kb']:.1f}KB → {result['peak_kb']:.1f}KB")
+    return regressions
+
+def main():
+    """벤치마크 실행 (python -m benchmarks.run)"""
+    parser = argparse.ArgumentParser(description="파서/분석 벤치마크 (기록된 픽스처 사용, 네트워크 없음)")
+    parser.add_argument("--repeat", type=int, default=20, help="항목별 반복 횟수")
+    parser.add_argument("--filter", default="", help="이름에 이 문자열이 포함된 항목만 실행")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준 결과 파일 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준으로 저장")
+    parser.add_argument("--no-compare", action="store_true", help="기준 결과와 비교하지 않고 측정만 실행")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용하는 실행 시간 증가 비율")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2, help="허용하는 최대 메모리 증가 비율")
+    args = parser.parse_args()
+    
+    articles, searches = load_fixtures()
+    
+    problems = verify_fixtures(articles)
+    if problems:
+        print(f"픽스처 확인 실패 {len(problems)}건:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    
+    cases = [case for case in build_cases(articles, searches) if args.filter in case[0]]
+    
+    baseline = {}
+    if os.path.exists(args.baseline) and not (args.save_baseline or args.no_compare):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    
+    print(f"파서: {PARSER}, 반복: {args.repeat}, 픽스처: 기사 {len(articles)}개, 검색 {len(searches)}개")
+    print(f"{'항목':<42}{'중앙값 ms':>11}{'최소 ms':>10}{'문서/초':>10}{'MB/초':>8}{'최대 KB':>10}{'기준 대비':>10}")
+    
+    results = {}
+    for name, func, docs, size in cases:
+        result = results[name] = measure(func, args.repeat, docs, size)
+        base = baseline.get(name)
+        ratio = f"{result['min_ms'] / base['min_ms']:.2f}x" if base else "-"
+        mb_per_sec = f"{result['mb_per_sec']:.2f}" if result["mb_per_sec"] else "-"
+        print(f"{name:<42}{result['median_ms']:>11.3f}{result['min_ms']:>10.3f}{result['docs_per_sec']:>10.1f}"
+              f"{mb_per_sec:>8}{result['peak_kb']:>10.1f}{ratio:>10}")
+    
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"parser": PARSER, "python": sys.version.split()[0], "results": results}, f, indent=2)
+        print(f"기준 결과 저장: {args.baseline}")
+        return 0
+    
+    if args.no_compare:
+        return 0
+    
+    if not baseline:
+        print("기준 결과가 없습니다. --save-baseline으로 먼저 저장하거나 --no-compare로 실행하세요.")
+        return 1
+    
+    regressions = compare(results, baseline, args.tolerance, args.memory_tolerance)
+    if regressions:
+        print(f"\n성능 저하 {len(regressions)}건:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    
+    print("\n기준 대비 성능 저하 없음")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
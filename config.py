@@ -4,11 +4,20 @@ import os
 # 기본 설정
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# 뉴스 소스 주소 (부하 테스트 등에서 환경 변수로 재정의 가능)
+FOX_SITE_URL = os.environ.get("FOX_SITE_URL", "https://www.foxnews.com")
+FOX_SEARCH_URL = os.environ.get("FOX_SEARCH_URL", "https://moxie.foxnews.com/search/web")
+REUTERS_SITE_URL = os.environ.get("REUTERS_SITE_URL", "https://www.reuters.com")
+REUTERS_SEARCH_URL = os.environ.get(
+    "REUTERS_SEARCH_URL", REUTERS_SITE_URL + "/pf/api/v3/content/fetch/articles-by-search-v2"
+)
+
 # 크롤링 설정
 FOX_MAX_PAGES = 3
 REUTERS_MAX_PAGES = 3
-REQUEST_DELAY = 1.0  # 요청 간 지연 시간(초)
+REQUEST_DELAY = 1.0  # 요청 간 평균 간격(초)
 DEFAULT_LIMIT = 5    # 기본 검색 결과 개수
+DEFAULT_TOOL_BUDGET = 60.0  # 네트워크 도구의 기본 제한 시간(초), 넘으면 그때까지의 결과만 반환 (0이면 제한 없음)
 
 # HTTP 요청 설정
 USER_AGENTS = [
@@ -16,6 +25,100 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.0 Safari/605.1.15"
 ]
 
+# 호스트별 요청 속도 제한 (토큰 버킷)
+RATE_LIMIT_RATE = 1.0 / REQUEST_DELAY  # 호스트당 초당 요청 수
+RATE_LIMIT_BURST = 3                   # 대기 없이 연속으로 보낼 수 있는 요청 수
+RATE_LIMIT_JITTER = 0.5                # 대기 시간에 더하는 무작위 비율
+RATE_LIMIT_HOSTS = {}                  # 호스트별 (rate, burst) 재정의, 예: {"www.reuters.com": (0.5, 2)}
+
+# 업스트림 요청 재시도와 회로 차단 설정
+RETRY_ATTEMPTS = 3                     # 재시도를 포함한 최대 시도 횟수
+RETRY_BASE_DELAY = 0.5                 # 첫 재시도 전 최대 대기 시간(초), 시도마다 두 배 (0~상한에서 무작위)
+RETRY_MAX_DELAY = 8.0                  # 재시도 대기 상한(초), Retry-After가 이보다 길면 재시도하지 않음
+RETRY_STATUSES = (429, 500, 502, 503, 504)  # 재시도할 상태 코드 (연결 오류도 재시도)
+HEDGE_REQUESTS = True                  # 응답이 호스트의 p95 응답 시간을 넘기면 같은 요청을 하나 더 보냄 (속도 제한 예산이 남을 때만)
+HEDGE_QUANTILE = 0.95                  # 헤지 요청을 보내는 응답 시간 백분위수
+HEDGE_MIN_SAMPLES = 20                 # 헤지 요청을 시작하기 전에 필요한 호스트별 응답 시간 표본 수
+BREAKER_FAILURE_THRESHOLD = 5          # 회로를 여는 연속 실패 수 (연결 오류, 429, 5xx)
+BREAKER_RESET_TIMEOUT = 30             # 회로가 열린 뒤 시험 요청을 보내기까지 대기 시간(초)
+BREAKER_PROBE_SUCCESSES = 2            # 회로를 다시 닫는 데 필요한 연속 시험 요청 성공 수
+
+# 검색 결과 캐시 설정
+SEARCH_CACHE_TTL = 300                  # 캐시 유효 시간(초)
+SEARCH_CACHE_GRACE = 600                # 만료 후 이전 값을 반환하며 갱신하는 유예 시간(초)
+SEARCH_CACHE_MAX_ENTRIES = 512          # 최대 캐시 항목 수
+SEARCH_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 최대 캐시 크기(바이트, 근사치)
+
+# 기사 저장소 설정
+ARTICLE_STORE_PATH = os.path.join(BASE_DIR, "data", "articles.db")  # SQLite 파일 경로
+ARTICLE_STORE_MAX_BYTES = 200 * 1024 * 1024  # 최대 저장 용량(바이트), 초과 시 오래 사용되지 않은 기사부터 삭제
+
+# 중복 기사 감지 설정
+DUPLICATE_TITLE_THRESHOLD = 0.5       # 제목+요약 MinHash 추정 유사도(Jaccard) 기준
+DUPLICATE_BODY_DISTANCE = 3           # 본문 SimHash 해밍 거리 기준 (64비트 중)
+DUPLICATE_MINHASH_PERMUTATIONS = 64   # MinHash 서명 길이
+DUPLICATE_MINHASH_BANDS = 16          # LSH 구간 수 (구간당 4개 값)
+DUPLICATE_INDEX_MAX_ENTRIES = 50000   # 색인별 최대 서명 수
+
+# 지표 설정
+METRICS_PROMETHEUS = True  # news://metrics 리소스로 Prometheus 텍스트 형식 지표 제공
+
+# 관심 검색어(워치리스트) 설정
+WATCHLIST_PATH = os.path.join(BASE_DIR, "data", "watchlist.json")  # 등록된 관심 검색어 저장 파일
+WATCHLIST_DEFAULT_INTERVAL = SEARCH_CACHE_TTL  # 기본 확인 주기(초), 캐시가 만료될 무렵 갱신
+WATCHLIST_MIN_INTERVAL = 60        # 최소 확인 주기(초)
+WATCHLIST_MAX_INTERVAL = SEARCH_CACHE_TTL + SEARCH_CACHE_GRACE  # 새 기사가 없을 때 늘어나는 주기의 상한(초)
+WATCHLIST_MAX_WATCHES = 50         # 최대 관심 검색어 수
+WATCHLIST_SEARCH_LIMIT = 20        # 확인할 때 가져오는 검색 결과 수
+WATCHLIST_PREFETCH_LIMIT = 10      # 확인 한 번에 미리 가져오는 새 기사 수
+WATCHLIST_QUIET_SECONDS = 2.0      # 마지막 도구 호출 후 이 시간이 지나야 백그라운드 요청 시작
+
+# 트레이싱 설정
+TRACE_SAMPLE_RATE = float(os.environ.get("TRACE_SAMPLE_RATE", "0"))  # 도구 호출을 트레이싱할 확률 (0이면 끔)
+TRACE_BUFFER_SIZE = 50  # 보관할 최근 트레이스 수 (news://traces에서 느린 순으로 확인)
+
+# 로컬 기사 검색 색인 설정
+SEARCH_INDEX_PATH = os.path.join(BASE_DIR, "data", "search_index.db")  # SQLite FTS5 색인 파일 경로
+SEARCH_INDEX_OPTIMIZE_INTERVAL = 1800  # 색인 압축 주기(초)
+
+# 커넥션 풀 설정
+HTTP_POOL_LIMIT = 100           # 전체 최대 동시 연결 수
+HTTP_POOL_LIMIT_PER_HOST = 8    # 호스트당 최대 동시 연결 수
+HTTP_DNS_CACHE_TTL = 300        # DNS 캐시 유지 시간(초)
+HTTP_KEEPALIVE_TIMEOUT = 30     # 유휴 연결 유지 시간(초)
+HTTP_REQUEST_TIMEOUT = 30       # 요청 하나의 최대 시간(초, 연결부터 본문 수신까지)
+HTTP_CONNECT_TIMEOUT = 10       # 연결(풀 대기 포함) 최대 시간(초)
+
+# 호스트별 적응형 동시 요청 수 (AIMD: 응답 시간이 평소 수준이면 늘리고, 과부하 응답이나 지연 급증 시 줄임)
+CONCURRENCY_INITIAL = 4                         # 처음 허용하는 호스트당 동시 요청 수
+CONCURRENCY_MIN = 1                             # 줄일 수 있는 하한
+CONCURRENCY_MAX = HTTP_POOL_LIMIT_PER_HOST      # 늘릴 수 있는 상한 (호스트당 연결 수를 넘지 않음)
+CONCURRENCY_BACKOFF = 0.5                       # 줄일 때 곱하는 비율
+CONCURRENCY_LATENCY_TOLERANCE = 2.0             # 최근 응답 시간이 평소의 몇 배를 넘으면 지연 급증으로 볼지
+
+# HTML 파싱 설정
+HTML_PARSER = "auto"  # "auto"(lxml 우선, 없으면 html.parser), "lxml", "html.parser"
+ARTICLE_STREAMING = True             # 본문 영역이 끝나면 나머지 응답을 읽지 않음
+ARTICLE_STREAM_CHUNK = 16 * 1024     # 스트리밍 읽기 단위(바이트)
+ARTICLE_MAX_BYTES = 5 * 1024 * 1024  # 기사 응답 최대 크기(바이트), 초과분은 읽지 않음
+PARSE_WORKER_MODE = "process"  # 기사 파싱 실행 방식: "process", "thread", "inline"(이벤트 루프에서 직접)
+PARSE_WORKERS = None           # 워커 수 (None이면 CPU 코어 수)
+
 # 분석 설정
-ENGLISH_STOPWORDS = ["the", "a", "an", "in", "on", "at", "to", "for", "of", "and", "is", "are", "was", "were"]
-MAX_KEYWORDS = 10    # 최대 키워드 수
\ No newline at end of file
+ENGLISH_STOPWORDS = [
+    "the", "a", "an", "in", "on", "at", "to", "for", "of", "and", "is", "are", "was", "were",
+    "be", "been", "being", "has", "have", "had", "having", "do", "does", "did", "will", "would",
+    "shall", "should", "can", "could", "may", "might", "must", "not", "but", "or", "nor", "if",
+    "then", "than", "so", "as", "by", "with", "from", "into", "onto", "about", "over", "under",
+    "after", "before", "between", "through", "during", "against", "without", "within", "this",
+    "that", "these", "those", "there", "here", "what", "which", "who", "whom", "whose", "when",
+    "where", "why", "how", "all", "any", "both", "each", "few", "more", "most", "other", "some",
+    "such", "only", "own", "same", "too", "very", "just", "also", "its", "his", "her", "hers",
+    "him", "she", "they", "them", "their", "theirs", "our", "ours", "you", "your", "yours", "we",
+    "said", "says", "say", "told", "according", "one", "two", "new", "like", "out", "up", "down",
+    "off", "again", "further", "once", "while", "because", "until", "per", "via", "reuters"
+]
+MAX_KEYWORDS = 10    # 최대 키워드 수
+KEYWORD_METHOD = "tfidf"  # 키워드 점수 방식: "tfidf", "bm25"
+KEYWORD_BM25_K1 = 1.5     # BM25 단어 빈도 포화 계수
+KEYWORD_BM25_B = 0.75     # BM25 문서 길이 정규화 계수
\ No newline at end of file
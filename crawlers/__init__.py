@@ -1,6 +1,25 @@
 # crawlers/__init__.py
+from urllib.parse import urlsplit
+from config import FOX_SITE_URL, REUTERS_SITE_URL
 from .base_crawler import BaseCrawler
 from .fox_crawler import FoxCrawler
 from .reuters_crawler import ReutersCrawler
 
-__all__ = ['BaseCrawler', 'FoxCrawler', 'ReutersCrawler']
\ No newline at end of file
+# 모든 도구 모듈이 공유하는 크롤러 인스턴스
+fox_crawler = FoxCrawler()
+reuters_crawler = ReutersCrawler()
+
+# 설정된 사이트 주소(부하 테스트용 대체 서버 포함)의 호스트
+FOX_HOST = urlsplit(FOX_SITE_URL).netloc
+REUTERS_HOST = urlsplit(REUTERS_SITE_URL).netloc
+
+def get_crawler(url):
+    """URL에 맞는 크롤러 반환 (지원하지 않는 소스면 None)"""
+    host = urlsplit(url).netloc
+    if "foxnews.com" in url or host == FOX_HOST:
+        return fox_crawler
+    if "reuters.com" in url or host == REUTERS_HOST:
+        return reuters_crawler
+    return None
+
+__all__ = ['BaseCrawler', 'FoxCrawler', 'ReutersCrawler', 'fox_crawler', 'reuters_crawler', 'get_crawler']
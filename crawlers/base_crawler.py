@@ -1,8 +1,57 @@
 # crawlers/base_crawler.py
-import aiohttp
 import asyncio
 import random
-from config import USER_AGENTS, REQUEST_DELAY
+import time
+import aiohttp
+from urllib.parse import urlsplit
+from config import (
+    USER_AGENTS, RATE_LIMIT_RATE, RATE_LIMIT_BURST,
+    RATE_LIMIT_JITTER, RATE_LIMIT_HOSTS,
+    ARTICLE_STREAMING, ARTICLE_STREAM_CHUNK, ARTICLE_MAX_BYTES,
+    HTTP_REQUEST_TIMEOUT, HTTP_CONNECT_TIMEOUT,
+    CONCURRENCY_INITIAL, CONCURRENCY_MIN, CONCURRENCY_MAX,
+    CONCURRENCY_BACKOFF, CONCURRENCY_LATENCY_TOLERANCE
+)
+from crawlers.session import get_session
+from crawlers.resilience import retry_policy, breakers
+from storage.article_store import article_store
+from utils.async_helpers import (
+    HostRateLimiter, HostConcurrencyLimiter, SingleFlight, cancel_and_wait, time_remaining
+)
+from utils.metrics import metrics
+from utils.tracing import tracer
+from utils.cache import search_cache, normalize_query
+from utils.parsing import canonicalize_url, date_timestamp, get_charset, StreamEndDetector
+from utils.workers import run_in_worker
+
+# 모든 크롤러가 공유하는 호스트별 속도 제한기
+rate_limiter = HostRateLimiter(
+    RATE_LIMIT_RATE, RATE_LIMIT_BURST, RATE_LIMIT_JITTER, RATE_LIMIT_HOSTS
+)
+
+# 모든 크롤러가 공유하는 호스트별 적응형 동시 요청 제한 (속도 제한은 그대로 상한으로 적용)
+concurrency_limiter = HostConcurrencyLimiter(
+    CONCURRENCY_INITIAL, CONCURRENCY_MIN, CONCURRENCY_MAX,
+    CONCURRENCY_BACKOFF, CONCURRENCY_LATENCY_TOLERANCE
+)
+
+# 동일한 요청이 동시에 들어오면 네트워크 요청과 파싱을 한 번만 수행 (기다리는 호출이 모두 취소되면 요청도 취소)
+inflight = SingleFlight()
+
+# 워커에서 재사용하는 크롤러 인스턴스 (클래스별 하나)
+_worker_crawlers = {}
+
+def parse_article_job(crawler_class, html, encoding, url):
+    """워커에서 실행하는 기사 파싱 작업 (원본 HTML 바이트 → 기사 사전)"""
+    crawler = _worker_crawlers.get(crawler_class)
+    if crawler is None:
+        crawler = _worker_crawlers[crawler_class] = crawler_class()
+    
+    try:
+        text = html.decode(encoding, errors="replace")
+    except LookupError:
+        text = html.decode("utf-8", errors="replace")
+    return crawler.parse_article(text, url)
 
 class BaseCrawler:
     """뉴스 크롤러의 기본 클래스"""
@@ -15,29 +64,418 @@ class BaseCrawler:
             "Accept-Language": "en-US,en;q=0.5"
         }
     
-    async def fetch_articles(self, query):
-        """검색어에 맞는 기사 목록 가져오기"""
+    async def fetch_articles(self, query, limit=None, refresh=False, since=None, seen=(), on_page=None):
+        """
+        검색어에 맞는 기사 목록 가져오기
+        
+        refresh면 캐시를 읽지 않고 새로 가져와 캐시를 갱신하고, since(epoch 초)가 있으면
+        그보다 새 기사만 반환하며 since 이전 기사가 나오는 페이지에서 요청 중단
+        (seen: since와 게시 시간이 같지만 이미 반환한 기사 URL).
+        on_page는 페이지를 처리할 때마다 (페이지 번호, 그 페이지의 기사 목록)으로 호출하는 코루틴 함수
+        """
+        raise NotImplementedError("서브클래스에서 구현해야 함")
+    
+    def parse_article(self, html, url):
+        """기사 HTML에서 상세 내용 추출 ({"metadata", "content"} 또는 None)"""
         raise NotImplementedError("서브클래스에서 구현해야 함")
     
+    def is_article_end_region(self, name, attrs):
+        """이 태그가 닫히면 기사 추출에 필요한 부분을 다 읽은 것으로 보는 영역 (스트리밍용)"""
+        return False
+    
+    # 이 문자열을 포함한 스크립트가 닫혀도 다 읽은 것으로 판단 (없으면 None)
+    article_end_script = None
+    
     async def fetch_article_details(self, url):
-        """특정 URL의 기사 상세 내용 가져오기"""
-        raise NotImplementedError("서브클래스에서 구현해야 함")
+        """특정 URL의 기사 상세 내용 가져오기 (같은 기사의 동시 요청은 결과를 공유하고, 모두 취소되면 요청도 취소)"""
+        key = ("article", canonicalize_url(url))
+        return await inflight.do(key, lambda: self._fetch_article_details(url))
     
-    async def fetch_with_delay(self, url, headers=None, params=None):
-        """지연 시간을 적용한 HTTP 요청"""
+    async def _fetch_article_details(self, url):
+        """저장된 기사는 조건부 요청으로 재검증하고, 변경된 경우에만 파싱"""
+        with tracer.span("store_lookup"):
+            stored = await article_store.get(url)
+        
+        headers = dict(self.headers)
+        if stored:
+            if stored["etag"]:
+                headers["If-None-Match"] = stored["etag"]
+            if stored["last_modified"]:
+                headers["If-Modified-Since"] = stored["last_modified"]
+        
+        status, response_headers, html = await self.request(url, headers=headers, raw=True, stream=ARTICLE_STREAMING)
+        
+        # 변경되지 않았으면 다운로드와 파싱 없이 저장된 결과 사용
+        if status == 304 and stored:
+            article_store.counters["revalidated"] += 1
+            await article_store.touch(url)
+            return stored["article"]
+        
+        # 업스트림에 연결하지 못했으면 저장된 이전 결과 사용
+        if status is None and stored:
+            article_store.counters["stale_served"] += 1
+            return stored["article"]
+        
+        article_store.counters["misses"] += 1
+        if status != 200 or not html:
+            return None
+        
+        # 파싱은 이벤트 루프를 막지 않도록 워커 풀에서 실행
+        with tracer.span("parse", bytes=len(html)):
+            article = await run_in_worker(
+                parse_article_job, type(self), html, get_charset(response_headers), url
+            )
+        if article:
+            with tracer.span("store_put"):
+                await article_store.put(
+                    url, article,
+                    etag=response_headers.get("ETag"),
+                    last_modified=response_headers.get("Last-Modified")
+                )
+        return article
+    
+    async def fetch_search_page(self, query, page, loader, refresh=False):
+        """검색 결과 페이지를 캐시를 거쳐 가져오기 (loader: 실제 요청 코루틴 함수, refresh면 항상 새로 요청)"""
+        key = (self.name, normalize_query(query), page)
+        with tracer.span("search_page", source=self.name, page=page):
+            if refresh:
+                return await search_cache.reload(key, loader)
+            return await search_cache.get_or_load(key, loader)
+    
+    def is_available(self):
+        """검색 호스트의 회로 차단기가 요청을 거절하지 않는 상태인지"""
+        return breakers.breaker(urlsplit(self.base_url).netloc).available()
+    
+    def split_new(self, page_articles, since, seen=()):
+        """
+        최신순 기사 목록에서 since 이후 기사만 골라 (새 기사 목록, since 이전 기사를 만났는지) 반환
+        
+        게시 시간을 알 수 없는 기사와 since와 시간이 같은 이미 반환한 기사는 제외하되 페이지 요청을 중단하지 않음
+        """
+        fresh = []
+        for article in page_articles:
+            timestamp = date_timestamp(article.get("date"))
+            if timestamp is None or (timestamp == since and article.get("url") in seen):
+                continue
+            if timestamp < since:
+                return fresh, True
+            fresh.append(article)
+        return fresh, False
+    
+    async def paginate_offsets(self, fetch_page, parse_page, page_count, limit=None, since=None, seen=(), on_page=None):
+        """
+        오프셋으로 주소가 정해지는 페이지를 동시에 요청하고 순서대로 처리
+        
+        Args:
+            fetch_page: 페이지 번호를 받아 원본 데이터를 가져오는 코루틴 함수
+            parse_page: 원본 데이터를 기사 목록으로 변환 (None이면 마지막 페이지)
+            page_count: 요청할 최대 페이지 수
+            limit: 필요한 기사 수 (채우면 남은 요청 취소)
+            since: 이 시각(epoch 초) 이후 기사만 반환 (대부분 첫 페이지에서 끝나므로 페이지를 하나씩 요청)
+            seen: since와 게시 시간이 같지만 이미 반환한 기사 URL
+            on_page: 페이지를 처리할 때마다 (페이지 번호, 결과에 포함될 기사 목록)으로 호출하는 코루틴 함수
+        """
+        # 실제 전송 간격은 속도 제한기가 조절
+        if since is None:
+            tasks = [asyncio.create_task(fetch_page(page)) for page in range(page_count)]
+        else:
+            tasks = []
+        articles = []
+        
+        try:
+            for page in range(page_count):
+                if page == len(tasks):
+                    tasks.append(asyncio.create_task(fetch_page(page)))
+                
+                page_articles = parse_page(await tasks[page])
+                if not page_articles:
+                    break
+                
+                reached = False
+                if since is not None:
+                    page_articles, reached = self.split_new(page_articles, since, seen)
+                
+                if limit:
+                    page_articles = page_articles[:limit - len(articles)]
+                if on_page is not None:
+                    await on_page(page, page_articles)
+                
+                articles.extend(page_articles)
+                if reached or (limit and len(articles) >= limit):
+                    break
+        finally:
+            # 더 이상 필요 없는 페이지 요청 취소
+            await cancel_and_wait(tasks)
+        
+        return articles[:limit] if limit else articles
+    
+    async def paginate_cursor(self, fetch_page, parse_page, next_cursor, max_pages, limit=None, count_items=None, since=None, seen=(), on_page=None):
+        """
+        다음 페이지 커서를 따라가며 페이지를 처리 (현재 페이지 처리 중 다음 페이지를 미리 요청)
+        
+        Args:
+            fetch_page: (페이지 번호, 커서)를 받아 원본 데이터를 가져오는 코루틴 함수 (첫 페이지 커서는 None)
+            parse_page: 원본 데이터를 기사 목록으로 변환 (None이면 마지막 페이지)
+            next_cursor: 원본 데이터에서 다음 페이지 커서 추출 (없으면 None)
+            max_pages: 요청할 최대 페이지 수
+            limit: 필요한 기사 수 (채우면 남은 요청 취소)
+            count_items: 원본 데이터의 최대 기사 수 (limit을 채울 페이지면 미리 요청하지 않음)
+            since: 이 시각(epoch 초) 이후 기사만 반환 (since 이전 기사가 있는 페이지에서 중단하므로 미리 요청하지 않음)
+            seen: since와 게시 시간이 같지만 이미 반환한 기사 URL
+            on_page: 페이지를 처리할 때마다 (페이지 번호, 결과에 포함될 기사 목록)으로 호출하는 코루틴 함수
+        """
+        articles = []
+        next_task = None
+        data = await fetch_page(0, None)
+        
+        try:
+            for page in range(max_pages):
+                if next_task is not None:
+                    data = await next_task
+                    next_task = None
+                
+                # 커서를 알게 되는 즉시 다음 페이지 요청 시작
+                cursor = next_cursor(data) if data else None
+                has_next = cursor and page < max_pages - 1
+                may_fill = has_next and limit and count_items and len(articles) + count_items(data) >= limit
+                if has_next and not may_fill and since is None:
+                    next_task = asyncio.create_task(fetch_page(page + 1, cursor))
+                
+                page_articles = parse_page(data)
+                if page_articles is None:
+                    break
+                
+                reached = False
+                if since is not None:
+                    page_articles, reached = self.split_new(page_articles, since, seen)
+                
+                if limit:
+                    page_articles = page_articles[:limit - len(articles)]
+                if on_page is not None:
+                    await on_page(page, page_articles)
+                
+                articles.extend(page_articles)
+                if reached or (limit and len(articles) >= limit):
+                    break
+                
+                # 미리 요청하지 않은 경우 지금 다음 페이지 요청
+                if has_next and next_task is None:
+                    next_task = asyncio.create_task(fetch_page(page + 1, cursor))
+                elif not has_next:
+                    break
+        finally:
+            if next_task is not None:
+                await cancel_and_wait([next_task])
+        
+        return articles[:limit] if limit else articles
+    
+    async def request(self, url, headers=None, params=None, raw=False, stream=False):
+        """
+        호스트별 속도 제한, 재시도, 회로 차단을 적용한 HTTP GET (상태 코드, 응답 헤더, 본문 반환)
+        
+        연결 오류와 429/5xx 응답은 무작위 지수 백오프(Retry-After가 있으면 그 시간)로 재시도하고,
+        끝내 연결하지 못하면 (None, {}, None) 반환. 호스트의 회로 차단기가 열려 있으면 요청 없이 바로
+        (None, {}, None) 반환.
+        raw면 본문을 바이트로 반환하며 ARTICLE_MAX_BYTES까지만 읽고,
+        stream이면 기사 본문 영역이 끝나는 즉시 읽기를 멈춤.
+        도구 호출의 마감 시각이 있으면 속도 제한 대기와 요청 모두 그 안에서 끝나야 하며,
+        넘으면 asyncio.TimeoutError 발생
+        """
         if headers is None:
             headers = self.headers
+        
+        breaker = breakers.breaker(urlsplit(url).netloc)
+        result = (None, {}, None)
+        for attempt in range(retry_policy.attempts):
+            if not breaker.allow():
+                return result
+            
+            budget = time_remaining()
+            started = time.monotonic()
+            try:
+                result = await self._exchange(url, headers, params, raw, stream)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                remaining = time_remaining()
+                if remaining is not None and remaining <= 0:
+                    # 마감 시각이 지나 실패한 것은 호스트 장애로 보지 않고 그대로 전달
+                    breaker.release()
+                    raise
+                if budget is not None and time.monotonic() - started >= budget:
+                    # 공유 요청의 마감 시각이 도중에 늦춰져 이전 마감 시각에 끊긴 요청은 바로 다시 시도
+                    breaker.release()
+                    continue
+                breaker.record(False)
+                result = (None, {}, None)
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                breaker.record(not retry_policy.is_failure(result[0]))
+            
+            if not retry_policy.should_retry(result[0]):
+                return result
+            
+            # 재시도 대기가 마감 시각을 넘기면 마지막 결과 반환
+            delay = retry_policy.delay(attempt, result[1])
+            remaining = time_remaining()
+            if delay is None or (remaining is not None and delay >= remaining):
+                break
+            
+            retry_policy.counters["retries"] += 1
+            with tracer.span("retry_wait", attempt=attempt + 1, status=result[0]):
+                await asyncio.sleep(delay)
+        
+        retry_policy.counters["exhausted"] += 1
+        return result
+    
+    async def _exchange(self, url, headers, params, raw, stream):
+        """
+        속도 제한 대기 후 요청 하나를 보내고, 응답이 호스트의 p95 응답 시간을 넘기면
+        같은 요청을 하나 더 보내 먼저 끝난 응답 사용 (헤지 요청은 속도 제한 예산이 남을 때만)
+        """
+        # 호스트 예산이 소진된 경우에만 대기
+        with tracer.span("rate_limit"):
+            await asyncio.wait_for(rate_limiter.acquire(url), self._remaining_budget())
+        
+        host = urlsplit(url).netloc
+        delay = retry_policy.hedge_delay(metrics.hosts.get(host))
+        if delay is None:
+            return await self._send(url, headers, params, raw, stream)
+        
+        tasks = [asyncio.create_task(self._send(url, headers, params, raw, stream))]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=delay)
+            # 동시 요청 자리와 속도 제한 예산이 모두 남을 때만 헤지
+            if not done and concurrency_limiter.limit(host).has_capacity() and rate_limiter.try_acquire(url):
+                retry_policy.counters["hedged"] += 1
+                tasks.append(asyncio.create_task(self._send(url, headers, params, raw, stream, hedge=True)))
             
-        # 요청 간 지연 적용
-        await asyncio.sleep(REQUEST_DELAY * (0.5 + random.random()))
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status != 200:
-                    return None
-                
-                content_type = response.headers.get('Content-Type', '')
-                if 'application/json' in content_type:
-                    return await response.json()
-                else:
-                    return await response.text()
\ No newline at end of file
+            # 먼저 성공한 응답 사용 (모두 실패하면 원래 요청의 오류 전달)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            retry_policy.counters["hedge_wins"] += 1
+                        return task.result()
+            return tasks[0].result()
+        finally:
+            await cancel_and_wait(tasks)
+    
+    async def _send(self, url, headers, params, raw, stream, hedge=False):
+        """
+        호스트의 동시 요청 자리를 받아 요청 하나를 보내고 호스트별 상태 코드, 다운로드 크기,
+        응답 시간(대기 제외)을 기록 (응답 시간과 과부하 응답은 동시 요청 제한에 반영)
+        """
+        limit = concurrency_limiter.limit(urlsplit(url).netloc)
+        with tracer.span("concurrency_wait"):
+            await asyncio.wait_for(limit.acquire(), self._remaining_budget())
+        
+        # 남은 시간이 세션 기본 제한보다 짧으면 그 시간으로 제한
+        options = {}
+        try:
+            remaining = self._remaining_budget()
+        except asyncio.TimeoutError:
+            limit.release()
+            raise
+        if remaining is not None and remaining < HTTP_REQUEST_TIMEOUT:
+            options["timeout"] = aiohttp.ClientTimeout(
+                total=remaining, connect=min(remaining, HTTP_CONNECT_TIMEOUT)
+            )
+        
+        start = time.perf_counter()
+        status = None
+        size = 0
+        try:
+            # 공유 세션으로 커넥션 재사용 (연결 대기, DNS, 연결 시간은 세션의 TraceConfig가 기록)
+            session = await get_session()
+            with tracer.span("http", url=url, hedge=hedge) as span:
+                async with session.get(url, headers=headers, params=params, **options) as response:
+                    status = response.status
+                    span.set(status=status)
+                    if response.status != 200:
+                        return response.status, response.headers, None
+                    
+                    content_type = response.headers.get('Content-Type', '')
+                    with tracer.span("download") as download:
+                        if raw:
+                            body = await self._read_body(response, stream)
+                            size = len(body)
+                        else:
+                            # 본문을 한 번 읽어 두면 json()/text()는 읽은 본문을 재사용
+                            size = len(await response.read())
+                        download.set(bytes=size)
+                    
+                    if raw:
+                        return response.status, response.headers, body
+                    if 'application/json' in content_type:
+                        return response.status, response.headers, await response.json()
+                    else:
+                        return response.status, response.headers, await response.text()
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            metrics.record_request(url, status, size, duration)
+            self._release_slot(limit, status, duration)
+    
+    def _release_slot(self, limit, status, duration):
+        """동시 요청 자리를 반환하며 결과 반영 (취소와 마감 초과는 반영하지 않음)"""
+        if status == "cancelled":
+            limit.release()
+        elif status is None:
+            # 연결 실패와 응답 지연으로 인한 제한 시간 초과는 과부하 신호
+            remaining = time_remaining()
+            limit.release(overloaded=remaining is None or remaining > 0)
+        else:
+            limit.release(duration, overloaded=status in (429, 503))
+    
+    def _remaining_budget(self):
+        """마감 시각까지 남은 시간 (마감이 없으면 None, 이미 지났으면 asyncio.TimeoutError)"""
+        remaining = time_remaining()
+        if remaining is not None and remaining <= 0:
+            raise asyncio.TimeoutError()
+        return remaining
+    
+    async def _read_body(self, response, stream):
+        """응답 본문을 청크 단위로 읽고, 필요한 부분을 다 읽었거나 최대 크기에 도달하면 중단"""
+        detector = self._end_detector(get_charset(response.headers)) if stream else None
+        
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(ARTICLE_STREAM_CHUNK):
+            chunks.append(chunk)
+            size += len(chunk)
+            
+            if size >= ARTICLE_MAX_BYTES or (detector and detector.feed(chunk)):
+                # 나머지는 받지 않고 연결을 닫아 풀에 자리를 돌려줌
+                response.close()
+                break
+        
+        return b"".join(chunks)[:ARTICLE_MAX_BYTES]
+    
+    def _end_detector(self, encoding):
+        return StreamEndDetector(self.is_article_end_region, self.article_end_script, encoding)
+    
+    def streamed_prefix(self, html, encoding="utf-8"):
+        """원본 HTML 바이트 중 스트리밍 읽기(_read_body)가 파서에 넘기는 앞부분 (벤치마크/확인용)"""
+        detector = self._end_detector(encoding)
+        size = 0
+        for start in range(0, len(html), ARTICLE_STREAM_CHUNK):
+            chunk = html[start:start + ARTICLE_STREAM_CHUNK]
+            size += len(chunk)
+            if size >= ARTICLE_MAX_BYTES or detector.feed(chunk):
+                break
+        return html[:min(size, ARTICLE_MAX_BYTES)]
+    
+    async def fetch_with_delay(self, url, headers=None, params=None):
+        """호스트별 속도 제한을 적용한 HTTP 요청 (200이 아니면 None, 동일한 동시 요청은 결과를 공유하고 모두 취소되면 요청도 취소)"""
+        key = ("get", url, tuple(sorted((params or {}).items())))
+        
+        async def fetch():
+            _, _, body = await self.request(url, headers=headers, params=params)
+            return body
+        
+        return await inflight.do(key, fetch)
\ No newline at end of file
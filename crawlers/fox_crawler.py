@@ -1,10 +1,31 @@
 # crawlers/fox_crawler.py
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from datetime import datetime
 from crawlers.base_crawler import BaseCrawler
-from config import FOX_MAX_PAGES
+from config import FOX_MAX_PAGES, FOX_SEARCH_URL, FOX_SITE_URL
+from utils.parsing import RegionStrainer, get_classes, make_soup
+
+# 기사 추출에 사용하는 영역 (class 기준)
+ARTICLE_REGION_CLASSES = {
+    "article-meta-upper": None,
+    "author-byline": None,
+    "headline": "h1",
+    "sub-headline": "h2",
+    "article-date": "span",
+    "article-body": "div"
+}
+
+def is_article_region(name, attrs):
+    """메타데이터와 본문이 들어 있는 태그인지 확인"""
+    for class_name in get_classes(attrs):
+        if class_name in ARTICLE_REGION_CLASSES:
+            tag_name = ARTICLE_REGION_CLASSES[class_name]
+            if tag_name is None or tag_name == name:
+                return True
+    return False
+
+ARTICLE_STRAINER = RegionStrainer(is_article_region)
 
 class FoxCrawler(BaseCrawler):
     """Fox News 크롤러"""
@@ -12,65 +33,74 @@ class FoxCrawler(BaseCrawler):
     def __init__(self):
         super().__init__()
         self.name = "Fox News"
-        self.base_url = "https://moxie.foxnews.com/search/web"
+        self.base_url = FOX_SEARCH_URL
         self.max_pages = FOX_MAX_PAGES
     
-    async def fetch_articles(self, query):
-        """Fox News에서 기사 검색"""
-        base_url = self.base_url
+    async def fetch_articles(self, query, limit=None, refresh=False, since=None, seen=(), on_page=None):
+        """Fox News에서 기사 검색 (limit개를 채우거나 since 이전 기사가 나오면 페이지 요청 중단)"""
         params = {
             "fields": "web",
             "q": query,
             "start": 1
         }
         
-        articles = []
+        async def fetch_page(page, next_url):
+            if next_url is None:
+                loader = lambda: self.fetch_with_delay(self.base_url, params=params)
+            else:
+                loader = lambda: self.fetch_with_delay(next_url)
+            return await self.fetch_search_page(query, page, loader, refresh)
         
-        # 첫 페이지 요청
-        data = await self.fetch_with_delay(base_url, params=params)
-        if not data:
-            return articles
-            
-        # 모든 페이지 처리
-        for _ in range(self.max_pages):
-            if not data or not isinstance(data, dict):
-                break
-                
-            # 기사 추출
-            for article in data.get("data", []):
-                if article.get("type") == "article":  
-                    attributes = article.get("attributes", {})
-                    category = attributes.get("section", "")
-                    
-                    # 비디오만 있는 기사 제외
-                    if category not in ["fox-news.video", "category"]:
-                        articles.append({
-                            "title": attributes.get("title", ""),
-                            "description": attributes.get("description", ""),
-                            "url": attributes.get("canonical_url", ""),
-                            "thumbnail": attributes.get("thumbnail", ""),
-                            "date": attributes.get("publication_date", ""),
-                            "category": category,
-                            "source": "Fox News"
-                        })
-            
-            # 다음 페이지 URL 확인
-            next_url = data.get("links", {}).get("next", None)
-            if not next_url:
-                break
+        return await self.paginate_cursor(
+            fetch_page,
+            self._parse_search_page,
+            self._next_page_url,
+            self.max_pages,
+            limit=limit,
+            count_items=lambda data: len(data.get("data", [])),
+            since=since,
+            seen=seen,
+            on_page=on_page
+        )
+    
+    def _next_page_url(self, data):
+        """검색 결과에서 다음 페이지 URL 추출"""
+        if not isinstance(data, dict):
+            return None
+        return data.get("links", {}).get("next", None)
+    
+    def _parse_search_page(self, data):
+        """검색 결과 한 페이지를 기사 목록으로 변환"""
+        if not data or not isinstance(data, dict) or not data.get("data"):
+            return None
+        
+        articles = []
+        for article in data.get("data", []):
+            if article.get("type") == "article":  
+                attributes = article.get("attributes", {})
+                category = attributes.get("section", "")
                 
-            # 다음 페이지 요청
-            data = await self.fetch_with_delay(next_url)
-            
+                # 비디오만 있는 기사 제외
+                if category not in ["fox-news.video", "category"]:
+                    articles.append({
+                        "title": attributes.get("title", ""),
+                        "description": attributes.get("description", ""),
+                        "url": attributes.get("canonical_url", ""),
+                        "thumbnail": attributes.get("thumbnail", ""),
+                        "date": attributes.get("publication_date", ""),
+                        "category": category,
+                        "source": "Fox News"
+                    })
+        
         return articles
     
-    async def fetch_article_details(self, url):
-        """Fox News 기사의 상세 내용 가져오기"""
-        html = await self.fetch_with_delay(url)
-        if not html:
-            return None
-            
-        soup = BeautifulSoup(html, "html.parser")
+    def is_article_end_region(self, name, attrs):
+        """본문 컨테이너가 닫히면 필요한 부분을 다 읽은 것"""
+        return name == "div" and "article-body" in get_classes(attrs)
+    
+    def parse_article(self, html, url):
+        """Fox News 기사 HTML에서 상세 내용 추출 (필요한 영역만 파싱)"""
+        soup = make_soup(html, parse_only=ARTICLE_STRAINER)
         
         # 메타데이터 추출
         metadata = {
@@ -158,7 +188,7 @@ class FoxCrawler(BaseCrawler):
         content = ''
         for child in element:
             if child.name == 'a':  # 링크가 포함된 경우
-                href = urljoin("https://www.foxnews.com", child.get('href', ''))
+                href = urljoin(FOX_SITE_URL, child.get('href', ''))
                 text = child.text.strip()
                 if href and text:
                     content += f"<x id='{href}'>{text}</x>"  # XML 태그로 감싸기
@@ -0,0 +1,162 @@
+# crawlers/resilience.py
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from config import (
+    RETRY_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY, RETRY_STATUSES,
+    HEDGE_REQUESTS, HEDGE_QUANTILE, HEDGE_MIN_SAMPLES,
+    BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT, BREAKER_PROBE_SUCCESSES
+)
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환 (없거나 잘못된 값이면 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class RetryPolicy:
+    """업스트림 요청의 재시도(무작위 지수 백오프)와 헤지 요청 정책"""
+    
+    def __init__(self, attempts=RETRY_ATTEMPTS, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY,
+                 statuses=RETRY_STATUSES, hedge=HEDGE_REQUESTS, hedge_quantile=HEDGE_QUANTILE,
+                 hedge_min_samples=HEDGE_MIN_SAMPLES):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.counters = {"retries": 0, "exhausted": 0, "hedged": 0, "hedge_wins": 0}
+    
+    def is_failure(self, status):
+        """호스트 장애로 보는 결과인지 (응답 없음, 429, 5xx)"""
+        return status is None or status == 429 or status >= 500
+    
+    def should_retry(self, status):
+        return status is None or status in self.statuses
+    
+    def delay(self, attempt, headers=None):
+        """
+        attempt번째(0부터) 시도가 실패한 뒤 재시도 전 대기 시간 (재시도하지 않으면 None)
+        
+        Retry-After가 있으면 그 시간을 따르고, 없으면 0~base_delay*2^attempt 사이 무작위 시간
+        """
+        if attempt + 1 >= self.attempts:
+            return None
+        
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+    
+    def hedge_delay(self, host_metrics):
+        """헤지 요청을 보내기까지 기다릴 시간 (호스트 응답 시간 백분위수, 표본이 부족하면 None)"""
+        if not self.hedge or host_metrics is None or host_metrics.latency.count < self.hedge_min_samples:
+            return None
+        delay = host_metrics.latency.quantile(self.hedge_quantile)
+        return delay if delay != float("inf") else None
+    
+    def stats(self):
+        return dict(self.counters)
+
+class CircuitBreaker:
+    """
+    연속 실패가 쌓이면 요청을 바로 거절하는 회로 차단기
+    
+    closed: 정상, open: reset_timeout 동안 모든 요청 거절,
+    half_open: 시험 요청을 하나씩만 보내고 probe_successes번 연속 성공하면 closed, 실패하면 다시 open
+    """
+    
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_timeout=BREAKER_RESET_TIMEOUT,
+                 probe_successes=BREAKER_PROBE_SUCCESSES):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe_successes = probe_successes
+        self.state = "closed"
+        self.failures = 0        # 연속 실패 수
+        self.successes = 0       # half_open에서 연속 성공 수
+        self.probing = False     # 시험 요청이 진행 중인지
+        self.opened_at = 0.0
+        self.counters = {"opened": 0, "rejected": 0}
+    
+    def available(self):
+        """지금 요청을 보낼 수 있는 상태인지 (상태는 바꾸지 않음)"""
+        if self.state == "open":
+            return time.monotonic() - self.opened_at >= self.reset_timeout
+        return self.state == "closed" or not self.probing
+    
+    def allow(self):
+        """요청을 보내도 되면 True (허용한 요청은 record 또는 release로 결과를 알려야 함)"""
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = "half_open"
+            self.successes = 0
+        
+        if self.state == "closed":
+            return True
+        if self.state == "half_open" and not self.probing:
+            self.probing = True
+            return True
+        
+        self.counters["rejected"] += 1
+        return False
+    
+    def record(self, success):
+        """허용한 요청의 결과 반영"""
+        self.probing = False
+        if success:
+            self.failures = 0
+            if self.state == "half_open":
+                self.successes += 1
+                if self.successes >= self.probe_successes:
+                    self.state = "closed"
+            return
+        
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self._open()
+    
+    def release(self):
+        """허용한 요청이 결과 없이 끝남 (취소, 마감 초과)"""
+        self.probing = False
+    
+    def _open(self):
+        if self.state != "open":
+            self.counters["opened"] += 1
+        self.state = "open"
+        self.opened_at = time.monotonic()
+    
+    def stats(self):
+        stats = {"state": self.state, "consecutive_failures": self.failures, **self.counters}
+        if self.state == "open":
+            stats["retry_in"] = round(max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at)), 1)
+        return stats
+
+class HostCircuitBreakers:
+    """호스트별 회로 차단기 모음"""
+    
+    def __init__(self):
+        self.breakers = {}
+    
+    def breaker(self, host):
+        """호스트의 회로 차단기 반환 (없으면 생성)"""
+        if host not in self.breakers:
+            self.breakers[host] = CircuitBreaker()
+        return self.breakers[host]
+    
+    def stats(self):
+        return {host: breaker.stats() for host, breaker in sorted(self.breakers.items())}
+
+# 모든 크롤러가 공유하는 재시도 정책과 호스트별 회로 차단기
+retry_policy = RetryPolicy()
+breakers = HostCircuitBreakers()
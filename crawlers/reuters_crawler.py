@@ -1,12 +1,31 @@
 # crawlers/reuters_crawler.py
+import logging
 import re
-from bs4 import BeautifulSoup
+from html import unescape
 from urllib.parse import quote, urljoin, urlsplit
 from datetime import datetime
 from crawlers.base_crawler import BaseCrawler
-from config import REUTERS_MAX_PAGES
+from config import REUTERS_MAX_PAGES, REUTERS_SEARCH_URL, REUTERS_SITE_URL
+from utils.parsing import RegionStrainer, make_soup, find_json_after, find_json_ld
 import time
-import asyncio
+
+logger = logging.getLogger(__name__)
+
+def is_article_region(name, attrs):
+    """제목, 시간, 작성자 링크, 본문 컨테이너인지 확인"""
+    if name in ("h1", "time"):
+        return True
+    if name == "a":
+        rel = attrs.get("rel") or ""
+        return "author" in (rel.split() if isinstance(rel, str) else rel)
+    return name == "div" and attrs.get("data-testid") == "ArticleBody"
+
+ARTICLE_STRAINER = RegionStrainer(is_article_region)
+
+# 페이지 상태 JSON의 단락 HTML 처리용
+ELEMENT_PATTERN = re.compile(r"<(\w+)\b([^>]*)>(.*?)</\1\s*>|<[^>]+>", re.IGNORECASE | re.DOTALL)
+HREF_PATTERN = re.compile(r"\bhref=[\"']([^\"']*)[\"']", re.IGNORECASE)
+TAG_PATTERN = re.compile(r"<[^>]+>")
 
 class ReutersCrawler(BaseCrawler):
     """Reuters 크롤러"""
@@ -14,20 +33,18 @@ class ReutersCrawler(BaseCrawler):
     def __init__(self):
         super().__init__()
         self.name = "Reuters"
-        self.base_url = "https://www.reuters.com/pf/api/v3/content/fetch/articles-by-search-v2"
+        self.base_url = REUTERS_SEARCH_URL
         self.max_pages = REUTERS_MAX_PAGES
 
-    async def fetch_articles(self, query):
-        """Reuters에서 기사 검색"""
-        articles = []
+    async def fetch_articles(self, query, limit=None, refresh=False, since=None, seen=(), on_page=None):
+        """Reuters에서 기사 검색 (limit개를 채우거나 since 이전 기사가 나오면 페이지 요청 중단)"""
         size = 20
-        offset = 0
 
-        for page in range(self.max_pages):
+        async def fetch_page(page):
             # 🔧 query를 dict로 만들고 str→replace로 JSON 형식화
             query_dict = {
                 "keyword": query,
-                "offset": offset,
+                "offset": page * size,
                 "orderby": "display_date:desc",
                 "size": size,
                 "website": "reuters"
@@ -38,45 +55,202 @@ class ReutersCrawler(BaseCrawler):
                 "mxId": "00000000",
                 "_website": "reuters"
             }
+            return await self.fetch_search_page(
+                query, page, lambda: self.fetch_with_delay(self.base_url, params=params), refresh
+            )
 
-            # fetch_with_delay 호출
-            data = await self.fetch_with_delay(self.base_url, params=params)
-            if not data or not isinstance(data, dict) or 'result' not in data:
-                break
+        # 최신순 결과이므로 limit개를 채우는 데 필요한 페이지만 요청
+        page_count = self.max_pages
+        if limit:
+            page_count = min(page_count, -(-limit // size))
 
-            page_articles = data['result'].get('articles', [])
-            if not page_articles:
-                break
+        return await self.paginate_offsets(
+            fetch_page, self._parse_search_page, page_count, limit=limit, since=since, seen=seen, on_page=on_page
+        )
 
-            for article in page_articles:
-                thumbnail_data = article.get("thumbnail", {})
-                articles.append({
-                    "title": article.get("title", ""),
-                    "description": article.get("description", ""),
-                    "url": "https://www.reuters.com" + article.get("canonical_url", ""),
-                    "thumbnail": thumbnail_data.get("url", "") if thumbnail_data else "",
-                    "date": article.get("published_time", ""),
-                    "category": article.get("category", ""),
-                    "source": "Reuters"
-                })
+    def _parse_search_page(self, data):
+        """검색 결과 한 페이지를 기사 목록으로 변환"""
+        if not data or not isinstance(data, dict) or 'result' not in data:
+            return None
 
-            offset += size
-            if page == self.max_pages - 1:
-                break
+        page_articles = data['result'].get('articles', [])
+        if not page_articles:
+            return None
 
-            # Optional: 서버 부담을 줄이기 위한 딜레이
-            await asyncio.sleep(1)
+        articles = []
+        for article in page_articles:
+            thumbnail_data = article.get("thumbnail", {})
+            articles.append({
+                "title": article.get("title", ""),
+                "description": article.get("description", ""),
+                "url": REUTERS_SITE_URL + article.get("canonical_url", ""),
+                "thumbnail": thumbnail_data.get("url", "") if thumbnail_data else "",
+                "date": article.get("published_time", ""),
+                "category": article.get("category", ""),
+                "source": "Reuters"
+            })
 
         return articles
 
     
-    async def fetch_article_details(self, url):
-        """Reuters 기사의 상세 내용 가져오기"""
-        html = await self.fetch_with_delay(url)
-        if not html:
+    # 페이지 상태 JSON 스크립트가 닫히면 추출에 충분. 이 스크립트는 본문 컨테이너 뒤에 올 수 있으므로
+    # 본문이 닫혀도 읽기를 멈추지 않음 (스크립트가 없는 페이지는 끝까지 읽음)
+    article_end_script = "Fusion.globalContent"
+    
+    def parse_article(self, html, url):
+        """
+        Reuters 기사 HTML에서 상세 내용 추출 (페이지 상태 JSON 우선, 없으면 DOM)
+        
+        Fusion JSON 경로는 같은 기사에서 DOM 경로와 같은 결과(공백, 링크 표기, 대표 이미지만)를 내도록
+        DOM 경로의 텍스트 처리를 그대로 따름. JSON-LD에는 본문 텍스트만 있으므로 링크, 부제목, 이미지가 없음
+        """
+        article = self._parse_page_state(html, url)
+        if article:
+            return article
+        return self._parse_dom(html, url)
+    
+    def _parse_page_state(self, html, url):
+        """페이지에 포함된 기사 JSON(Fusion.globalContent, JSON-LD)에서 추출 (DOM 생성 없음)"""
+        try:
+            content = find_json_after(html, "Fusion.globalContent")
+            if isinstance(content, dict):
+                story = content.get("result", content)
+                if isinstance(story, dict) and story.get("content_elements"):
+                    return self._article_from_fusion(story, url)
+            
+            for data in find_json_ld(html):
+                if data.get("@type") in ("NewsArticle", "Article", "ReportageNewsArticle") and data.get("articleBody"):
+                    return self._article_from_json_ld(data, url)
+        except Exception as e:
+            logger.warning("페이지 상태 JSON 파싱 중 오류: %s", e)
+        
+        return None
+    
+    def _article_from_fusion(self, story, url):
+        """Fusion 기사 데이터를 기사 사전으로 변환"""
+        headlines = story.get("headlines") or {}
+        authors = [a.get("name", "").strip() for a in story.get("authors", []) if a.get("name")]
+        
+        metadata = {
+            "url": url,
+            "headline": (story.get("title") or headlines.get("basic") or "Untitled").strip(),
+            "author": ", ".join(authors),
+            "published_date": self._format_date(
+                story.get("published_time") or story.get("display_date") or story.get("display_time")
+            ),
+            "source": "Reuters",
+            "category": self._category_from_url(url)
+        }
+        
+        content = []
+        
+        # 대표 이미지 (본문 중간 이미지는 DOM 경로와 같게 제외)
+        images = (story.get("related_content") or {}).get("images") or []
+        if images:
+            image = self._image_block(images[0])
+            if image:
+                content.append(image)
+        
+        for element in story.get("content_elements", []):
+            element_type = element.get("type")
+            
+            if element_type in ("paragraph", "text"):
+                paragraph_content = self._process_html_paragraph(element.get("content", ""))
+                if paragraph_content:
+                    content.append({"type": "text", "content": paragraph_content})
+            
+            elif element_type in ("header", "heading"):
+                heading = self._strip_tags(element.get("content", ""))
+                if heading:
+                    content.append({"type": "subheading", "content": heading})
+        
+        for order, item in enumerate(content):
+            item["order"] = order
+        
+        return {"metadata": metadata, "content": content}
+    
+    def _article_from_json_ld(self, data, url):
+        """JSON-LD NewsArticle을 기사 사전으로 변환"""
+        authors = data.get("author") or []
+        if isinstance(authors, dict):
+            authors = [authors]
+        author_names = [a.get("name", "").strip() for a in authors if isinstance(a, dict) and a.get("name")]
+        
+        metadata = {
+            "url": url,
+            "headline": (data.get("headline") or "Untitled").strip(),
+            "author": ", ".join(author_names),
+            "published_date": self._format_date(data.get("datePublished")),
+            "source": "Reuters",
+            "category": self._category_from_url(url)
+        }
+        
+        paragraphs = [p.strip() for p in data["articleBody"].split("\n") if p.strip()]
+        content = [
+            {"type": "text", "content": paragraph, "order": order}
+            for order, paragraph in enumerate(paragraphs)
+        ]
+        
+        return {"metadata": metadata, "content": content}
+    
+    def _image_block(self, image):
+        """이미지 데이터를 이미지 블록으로 변환"""
+        img_src = image.get("url") or image.get("resizer_url") or ""
+        if not img_src:
             return None
+        return {
+            "type": "image",
+            "image_url": img_src,
+            "alt": image.get("alt_text") or "Image",
+            # DOM 경로의 get_text(strip=True)처럼 텍스트 조각마다 공백을 없애고 이어 붙임
+            "caption": "".join(part.strip() for part in TAG_PATTERN.split(unescape(image.get("caption") or ""))),
+        }
+    
+    def _process_html_paragraph(self, html):
+        """JSON 단락 HTML을 DOM 경로의 _process_paragraph와 같은 형식(링크는 <x id='...'> 태그)으로 변환"""
+        paragraph_content = ""
+        position = 0
+        
+        # 최상위 텍스트와 링크만 사용하고, 그 밖의 요소는 DOM 경로처럼 내용까지 제외
+        for match in ELEMENT_PATTERN.finditer(html):
+            if match.start() > position:
+                paragraph_content += f" {unescape(html[position:match.start()]).strip()} "
+            position = match.end()
             
-        soup = BeautifulSoup(html, "html.parser")
+            if (match.group(1) or "").lower() == "a":
+                href = HREF_PATTERN.search(match.group(2))
+                href = urljoin(REUTERS_SITE_URL, unescape(href.group(1)) if href else "")
+                # 링크 안의 다른 요소에 든 텍스트는 제외 (DOM 경로의 find_all(string=True, recursive=False))
+                link_text = unescape(TAG_PATTERN.sub("", ELEMENT_PATTERN.sub("", match.group(3)))).strip()
+                if href and link_text:
+                    paragraph_content += f" <x id='{href}'>{link_text}</x> "
+        
+        if position < len(html):
+            paragraph_content += f" {unescape(html[position:]).strip()} "
+        
+        return paragraph_content.strip()
+    
+    def _strip_tags(self, html):
+        return unescape(TAG_PATTERN.sub("", html)).strip()
+    
+    def _category_from_url(self, url):
+        """URL 경로의 첫 부분을 카테고리로 사용"""
+        path_parts = [part for part in urlsplit(url).path.split('/') if part]
+        return path_parts[0] if len(path_parts) > 0 else "Uncategorized"
+    
+    def _format_date(self, value):
+        """ISO 8601 시간을 "%Y-%m-%d %H:%M:%S" 형식으로 변환 (없으면 현재 시간)"""
+        if value:
+            try:
+                parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+                return parsed.strftime("%Y-%m-%d %H:%M:%S")
+            except ValueError:
+                pass
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    def _parse_dom(self, html, url):
+        """DOM을 순회하며 추출 (페이지 상태 JSON이 없는 경우)"""
+        soup = make_soup(html, parse_only=ARTICLE_STRAINER)
         
         try:
             # URL에서 카테고리 추출
@@ -158,7 +332,7 @@ class ReutersCrawler(BaseCrawler):
             return {"metadata": metadata, "content": content}
             
         except Exception as e:
-            print(f"기사 파싱 중 오류: {str(e)}")
+            logger.warning("기사 파싱 중 오류: %s", e)
             return None
     
     def _process_paragraph(self, element):
@@ -167,7 +341,7 @@ class ReutersCrawler(BaseCrawler):
         
         for child in element.children:
             if child.name == "a" and "data-testid" in child.attrs and child["data-testid"] == "Link":
-                href = urljoin("https://www.reuters.com", child.get("href", ""))
+                href = urljoin(REUTERS_SITE_URL, child.get("href", ""))
                 link_text = "".join(t for t in child.find_all(string=True, recursive=False)).strip()
                 
                 if href and link_text:
@@ -0,0 +1,35 @@
+# crawlers/session.py
+import aiohttp
+from config import (
+    HTTP_POOL_LIMIT, HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL, HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_REQUEST_TIMEOUT, HTTP_CONNECT_TIMEOUT
+)
+from utils.tracing import tracer
+
+# 프로세스 전역에서 공유하는 HTTP 세션
+_session = None
+
+async def get_session():
+    """공유 HTTP 세션 반환 (최초 호출 시 생성)"""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+        )
+        # 트레이싱이 켜진 경우에만 연결 단계 이벤트 수집
+        trace_configs = [tracer.aiohttp_trace_config()] if tracer.enabled else None
+        # 응답이 없는 연결이 도구 호출을 오래 붙잡지 않도록 기본 제한 시간 설정
+        timeout = aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT)
+        _session = aiohttp.ClientSession(connector=connector, timeout=timeout, trace_configs=trace_configs)
+    return _session
+
+async def close_session():
+    """공유 HTTP 세션 종료"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -0,0 +1,252 @@
+# crawlers/watchlist.py
+import asyncio
+import json
+import logging
+import os
+import time
+from itertools import zip_longest
+from crawlers import fox_crawler, reuters_crawler, get_crawler
+from storage.article_store import article_store
+from utils.async_helpers import background_scope
+from utils.cache import normalize_query
+from utils.metrics import metrics
+from config import (
+    WATCHLIST_PATH, WATCHLIST_DEFAULT_INTERVAL, WATCHLIST_MIN_INTERVAL,
+    WATCHLIST_MAX_INTERVAL, WATCHLIST_MAX_WATCHES, WATCHLIST_SEARCH_LIMIT,
+    WATCHLIST_PREFETCH_LIMIT, WATCHLIST_QUIET_SECONDS
+)
+
+# 소스 이름 → 검색할 크롤러
+WATCH_SOURCES = {
+    "fox": [fox_crawler],
+    "reuters": [reuters_crawler],
+    "all": [fox_crawler, reuters_crawler]
+}
+
+# 도구 호출이 끝나기를 기다리며 확인하는 간격(초)
+IDLE_CHECK_INTERVAL = 0.5
+
+logger = logging.getLogger(__name__)
+
+class Watch:
+    """주기적으로 확인하는 관심 검색어 하나"""
+    
+    def __init__(self, query, source="all", interval=WATCHLIST_DEFAULT_INTERVAL, prefetch=True):
+        self.query = query
+        self.source = source
+        self.base_interval = interval
+        self.interval = interval   # 새 기사가 없으면 두 배씩 늘어나는 현재 주기
+        self.prefetch = prefetch
+        self.next_run = time.monotonic()
+        self.last_run = None       # 마지막 확인 시각 (epoch)
+        self.last_error = None
+        self.seen = set()          # 직전 확인에서 본 기사 URL
+        self.polls = 0
+        self.new_hits = 0
+        self.prefetched = 0
+    
+    @property
+    def id(self):
+        return f"{self.source}:{normalize_query(self.query)}"
+    
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "query": self.query,
+            "source": self.source,
+            "interval": self.base_interval,
+            "current_interval": self.interval,
+            "prefetch": self.prefetch,
+            "last_run": self.last_run,
+            "next_run_in": max(0, round(self.next_run - time.monotonic())),
+            "last_error": self.last_error,
+            "polls": self.polls,
+            "new_hits": self.new_hits,
+            "prefetched": self.prefetched
+        }
+
+class Watchlist:
+    """
+    관심 검색어를 주기적으로 검색해 검색 캐시를 갱신하고 새 기사를 미리 가져오는 스케줄러
+    
+    요청은 크롤러를 거치므로 호스트별 속도 제한을 그대로 따르며, 도구 호출이 진행 중이거나
+    막 끝난 경우에는 대기하여 사용자 요청과 경쟁하지 않음
+    """
+    
+    def __init__(self, path=WATCHLIST_PATH):
+        self.path = path
+        self.watches = {}
+        self.on_article = None  # 미리 가져온 기사를 색인에 반영하는 코루틴 함수
+        self.counters = {"polls": 0, "new_hits": 0, "prefetched": 0, "deferred": 0, "errors": 0}
+        self._wakeup = asyncio.Event()
+    
+    def load(self):
+        """저장된 관심 검색어 불러오기"""
+        if not os.path.exists(self.path):
+            return
+        
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("관심 검색어 파일을 읽지 못했습니다: %s", e)
+            return
+        
+        for entry in entries:
+            watch = Watch(entry["query"], entry.get("source", "all"),
+                          entry.get("interval", WATCHLIST_DEFAULT_INTERVAL), entry.get("prefetch", True))
+            self.watches.setdefault(watch.id, watch)
+    
+    def _save_sync(self, entries):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+    
+    async def save(self):
+        entries = [
+            {"query": watch.query, "source": watch.source, "interval": watch.base_interval, "prefetch": watch.prefetch}
+            for watch in self.watches.values()
+        ]
+        await asyncio.to_thread(self._save_sync, entries)
+    
+    async def add(self, query, source="all", interval=WATCHLIST_DEFAULT_INTERVAL, prefetch=True):
+        """관심 검색어 추가 (같은 소스와 검색어가 있으면 설정만 변경)"""
+        watch = Watch(query.strip(), source, max(WATCHLIST_MIN_INTERVAL, interval), prefetch)
+        existing = self.watches.get(watch.id)
+        if existing is None and len(self.watches) >= WATCHLIST_MAX_WATCHES:
+            raise ValueError(f"관심 검색어는 최대 {WATCHLIST_MAX_WATCHES}개까지 등록할 수 있습니다.")
+        
+        if existing is not None:
+            # 확인 기록은 유지하고 설정만 변경
+            existing.base_interval = existing.interval = watch.base_interval
+            existing.prefetch = prefetch
+            watch = existing
+        else:
+            self.watches[watch.id] = watch
+        
+        await self.save()
+        self._wakeup.set()
+        return watch
+    
+    async def remove(self, watch_id):
+        """관심 검색어 삭제 (없으면 False)"""
+        if self.watches.pop(watch_id, None) is None:
+            return False
+        await self.save()
+        return True
+    
+    def snapshot(self):
+        """다음 확인 시각 순서의 관심 검색어 목록"""
+        return [watch.to_dict() for watch in sorted(self.watches.values(), key=lambda watch: watch.next_run)]
+    
+    async def wait_for_idle(self, max_wait):
+        """도구 호출이 없을 때까지 대기 (max_wait초가 지나면 그대로 진행)"""
+        deadline = time.monotonic() + max_wait
+        deferred = False
+        while not metrics.idle(WATCHLIST_QUIET_SECONDS) and time.monotonic() < deadline:
+            deferred = True
+            await asyncio.sleep(IDLE_CHECK_INTERVAL)
+        if deferred:
+            self.counters["deferred"] += 1
+    
+    async def poll(self, watch):
+        """검색 결과를 새로 가져와 캐시를 갱신하고, 처음 보는 기사를 미리 가져오기"""
+        await self.wait_for_idle(watch.interval)
+        watch.polls += 1
+        self.counters["polls"] += 1
+        watch.last_run = time.time()
+        
+        try:
+            results = await asyncio.gather(*(
+                crawler.fetch_articles(watch.query, WATCHLIST_SEARCH_LIMIT, refresh=True)
+                for crawler in WATCH_SOURCES[watch.source]
+            ))
+            watch.last_error = None
+        except Exception as e:
+            watch.last_error = str(e)
+            self.counters["errors"] += 1
+            results = []
+        
+        # 소스별 결과를 번갈아 배치하여 미리 가져오기가 한 소스에 몰리지 않도록 함
+        urls = [
+            article["url"] for group in zip_longest(*results) for article in group
+            if article and article.get("url")
+        ]
+        new_urls = [url for url in urls if url not in watch.seen]
+        if results:
+            watch.seen = set(urls)
+        watch.new_hits += len(new_urls)
+        self.counters["new_hits"] += len(new_urls)
+        
+        if watch.prefetch:
+            await self.prefetch(watch, new_urls[:WATCHLIST_PREFETCH_LIMIT])
+        
+        # 새 기사가 없으면 확인 주기를 늘리고, 있으면 원래 주기로 복귀
+        if new_urls:
+            watch.interval = watch.base_interval
+        else:
+            watch.interval = min(watch.interval * 2, max(watch.base_interval, WATCHLIST_MAX_INTERVAL))
+        watch.next_run = time.monotonic() + watch.interval
+    
+    async def prefetch(self, watch, urls):
+        """
+        저장소에 없는 기사만 동시에 가져오기
+        
+        동시 요청 수는 크롤러의 호스트별 적응형 제한이 사이트 응답에 맞춰 조절하며,
+        백그라운드 요청이므로 도구 호출의 요청이 먼저 자리를 받음
+        """
+        missing = [url for url in urls if await article_store.get(url) is None]
+        if not missing:
+            return
+        
+        await self.wait_for_idle(watch.interval)
+        articles = await asyncio.gather(
+            *(get_crawler(url).fetch_article_details(url) for url in missing), return_exceptions=True
+        )
+        for article in articles:
+            if isinstance(article, Exception):
+                watch.last_error = str(article)
+                self.counters["errors"] += 1
+            elif article:
+                watch.prefetched += 1
+                self.counters["prefetched"] += 1
+                if self.on_article is not None:
+                    await self.on_article(article)
+    
+    async def run(self):
+        """확인할 때가 된 관심 검색어를 순서대로 확인 (서버 수명 주기 동안 실행)"""
+        self.load()
+        with background_scope():
+            await self._run_loop()
+    
+    async def _run_loop(self):
+        while True:
+            now = time.monotonic()
+            due = [watch for watch in self.watches.values() if watch.next_run <= now]
+            for watch in sorted(due, key=lambda watch: watch.next_run):
+                # 확인 중에 삭제된 검색어는 건너뜀
+                if self.watches.get(watch.id) is not watch:
+                    continue
+                try:
+                    await self.poll(watch)
+                except Exception as e:
+                    logger.exception("관심 검색어 확인 중 오류: %s", e)
+                    watch.last_error = str(e)
+                    watch.next_run = time.monotonic() + watch.interval
+            
+            # 다음 확인 시각까지, 또는 검색어가 추가될 때까지 대기
+            next_run = min((watch.next_run for watch in self.watches.values()), default=None)
+            timeout = None if next_run is None else max(0, next_run - time.monotonic())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+    
+    def stats(self):
+        return {**self.counters, "watches": len(self.watches)}
+
+# 서버 전체가 공유하는 관심 검색어 스케줄러
+watchlist = Watchlist()
@@ -0,0 +1,46 @@
+# lifespan.py
+import asyncio
+from contextlib import asynccontextmanager
+from crawlers.session import close_session
+from utils.cache import search_cache
+from storage.article_store import article_store
+from utils.workers import shutdown_workers
+from utils.keywords import keyword_index
+from utils.similarity import add_article_body
+from storage.search_index import search_index
+from crawlers.watchlist import watchlist
+from config import SEARCH_INDEX_OPTIMIZE_INTERVAL
+
+def seed_article_indexes():
+    """저장된 기사로 메모리 색인 구성"""
+    for article in article_store.iter_articles_sync():
+        keyword_index.add_article(article)
+        add_article_body(article)
+
+def seed_search_index():
+    """색인 기능 도입 전에 저장된 기사를 전문 색인에 추가 (색인이 비어 있을 때만)"""
+    if search_index.count_sync() == 0:
+        search_index.add_articles_sync(article_store.iter_articles_sync())
+
+@asynccontextmanager
+async def server_lifespan(server):
+    """서버 수명 주기 동안 공유 자원을 관리"""
+    # 저장된 기사로 키워드 문서 빈도 색인과 본문 중복 감지 색인을 백그라운드에서 구성
+    seeding = asyncio.create_task(asyncio.to_thread(seed_article_indexes))
+    # 전문 색인이 비어 있으면 저장된 기사로 채우고, 이후 주기적으로 압축
+    index_seeding = asyncio.create_task(asyncio.to_thread(seed_search_index))
+    compaction = asyncio.create_task(search_index.run_compaction(SEARCH_INDEX_OPTIMIZE_INTERVAL))
+    # 관심 검색어를 주기적으로 확인하여 캐시와 기사 저장소를 미리 채움
+    watching = asyncio.create_task(watchlist.run())
+    try:
+        yield {}
+    finally:
+        # 서버 종료 시 백그라운드 작업과 커넥션 풀 정리
+        for task in (watching, seeding, index_seeding, compaction):
+            task.cancel()
+        await asyncio.gather(watching, seeding, index_seeding, compaction, return_exceptions=True)
+        await search_cache.close()
+        await close_session()
+        article_store.close()
+        search_index.close()
+        shutdown_workers()
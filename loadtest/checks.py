@@ -0,0 +1,110 @@
+# loadtest/checks.py
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import warnings
+from loadtest.run import decode
+from loadtest.stub import StubSettings, StubUpstream
+
+# 남은 페이지가 속도 제한을 기다리는 동안 앞 페이지 응답이 도착하도록 호스트당 요청 수를 낮춤
+CHECK_RATE = 5.0
+
+async def check_early_stop(upstream, mcp):
+    """결과가 limit보다 먼저 끝나면 아직 보내지 않은 페이지 요청은 취소되어야 함"""
+    from crawlers import reuters_crawler
+    
+    # 결과 10개: 첫 페이지(20개 단위)만 채워지고 두 번째 페이지가 비어 있으면 세 번째 페이지는 필요 없음
+    upstream.settings.results = 10
+    before = upstream.counts["reuters_search"]
+    articles = await reuters_crawler.fetch_articles("earlystop", 60)
+    # 취소되지 않은 요청이 있다면 속도 제한을 기다린 뒤 전송될 시간
+    await asyncio.sleep(3 / CHECK_RATE)
+    requested = upstream.counts["reuters_search"] - before
+    
+    problems = []
+    if len(articles) != 10:
+        problems.append(f"기사 {len(articles)}개 반환 (10개여야 함)")
+    if requested != 2:
+        problems.append(f"검색 페이지 {requested}번 요청 (빈 페이지에서 멈췄다면 2번이어야 함)")
+    return problems
+
+async def check_batch_duplicates(upstream, mcp):
+    """제목이 같은 두 URL을 요청하면 기본은 duplicate_of로, dedupe=False면 둘 다 내용을 반환해야 함"""
+    from fastmcp import Client
+    from utils.parsing import canonicalize_url
+    from utils.similarity import headline_index, headline_signature
+    
+    # 앞선 검색에서 두 기사의 제목+요약이 같았던 것처럼 서명 등록
+    urls = [f"{upstream.fox_url}/politics/same-headline-{n}" for n in (1, 2)]
+    for url in urls:
+        headline_index.add(canonicalize_url(url), headline_signature({
+            "title": "Fed holds rates steady as officials signal cuts later this year",
+            "description": "Markets rallied after the announcement and Treasury yields fell."
+        }))
+    
+    problems = []
+    async with Client(mcp) as client:
+        before = upstream.counts["fox_article"]
+        result = decode(await client.call_tool("batch_fetch_articles", {"urls": urls}, raise_on_error=False))
+        requested = upstream.counts["fox_article"] - before
+        if not (isinstance(result, list) and len(result) == 2 and "metadata" in result[0]
+                and result[1] == {"url": urls[1], "duplicate_of": urls[0]}):
+            problems.append(f"기본 호출 결과: {result}")
+        if requested != 1:
+            problems.append(f"기본 호출에서 기사 {requested}번 요청 (중복 URL은 가져오지 않아야 함)")
+        
+        result = decode(await client.call_tool(
+            "batch_fetch_articles", {"urls": urls, "dedupe": False}, raise_on_error=False
+        ))
+        if not (isinstance(result, list) and len(result) == 2 and all("metadata" in article for article in result)):
+            problems.append(f"dedupe=False 결과에 두 기사의 내용이 없음: {result}")
+    return problems
+
+CHECKS = [check_early_stop, check_batch_duplicates]
+
+async def main_async(args):
+    upstream = StubUpstream(StubSettings(latency=0.05, jitter=0), fox_port=args.fox_port, reuters_port=args.reuters_port)
+    await upstream.start()
+    
+    # config를 읽기 전에 크롤러가 대체 서버를 사용하도록 설정
+    os.environ.update(upstream.environment())
+    import config
+    config.RATE_LIMIT_RATE = CHECK_RATE
+    config.RATE_LIMIT_BURST = 1
+    config.RATE_LIMIT_JITTER = 0
+    config.ARTICLE_STORE_PATH = os.path.join(args.data_dir, "articles.db")
+    config.SEARCH_INDEX_PATH = os.path.join(args.data_dir, "search_index.db")
+    config.WATCHLIST_PATH = os.path.join(args.data_dir, "watchlist.json")
+    from main import mcp
+    
+    logging.disable(logging.CRITICAL)
+    warnings.simplefilter("ignore")
+    
+    failed = 0
+    try:
+        for check in CHECKS:
+            problems = await check(upstream, mcp)
+            print(f"{'실패' if problems else '통과'}: {check.__name__} - {check.__doc__}")
+            for problem in problems:
+                print(f"  - {problem}")
+            failed += bool(problems)
+    finally:
+        await upstream.stop()
+    return 1 if failed else 0
+
+def main():
+    """대체 서버로 크롤러 동작 확인 (python -m loadtest.checks)"""
+    parser = argparse.ArgumentParser(description="대체 뉴스 서버를 사용한 크롤러 동작 확인 (업스트림 요청 수 등)")
+    parser.add_argument("--fox-port", type=int, default=8811)
+    parser.add_argument("--reuters-port", type=int, default=8812)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        args.data_dir = temp_dir
+        return asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    sys.exit(main())
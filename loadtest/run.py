@@ -0,0 +1,173 @@
+# loadtest/run.py
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import warnings
+from collections import defaultdict
+from loadtest.stub import StubSettings, StubUpstream
+
+# 시뮬레이션 클라이언트가 사용하는 검색어
+QUERIES = [
+    "tesla", "inflation", "election", "oil", "fed", "ukraine", "china", "apple",
+    "housing", "jobs", "climate", "court", "congress", "bitcoin", "tariffs", "storm"
+]
+
+def percentile(values, p):
+    """정렬된 목록의 p 백분위수 (최근접 순위)"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(p / 100 * len(values)) - 1))
+    return values[index]
+
+def decode(result):
+    """도구 결과의 JSON 본문 (내용이 없으면 None)"""
+    if not result.content:
+        return None
+    try:
+        return json.loads(result.content[0].text)
+    except (AttributeError, ValueError):
+        return None
+
+class LoadRun:
+    """여러 MCP 클라이언트로 도구를 호출하며 지연 시간과 오류를 기록"""
+    
+    def __init__(self, mcp, args):
+        self.mcp = mcp
+        self.args = args
+        self.latencies = defaultdict(list)  # 도구 → 지연 시간(초) 목록
+        self.errors = defaultdict(int)
+        self.urls = []  # 검색 결과에서 모은 기사 URL
+        self.queries = QUERIES[:max(1, args.queries)]
+    
+    async def call(self, client, name, arguments):
+        start = time.perf_counter()
+        try:
+            result = await client.call_tool(name, arguments, raise_on_error=False)
+            data = decode(result)
+            failed = result.is_error or (isinstance(data, dict) and "error" in data)
+        except Exception:
+            data, failed = None, True
+        
+        self.latencies[name].append(time.perf_counter() - start)
+        if failed:
+            self.errors[name] += 1
+        return data
+    
+    async def client_loop(self, deadline):
+        """한 클라이언트: 마감 시간까지 검색과 기사 가져오기를 섞어 호출"""
+        from fastmcp import Client
+        
+        async with Client(self.mcp) as client:
+            while time.perf_counter() < deadline:
+                if not self.urls or random.random() < self.args.search_ratio:
+                    articles = await self.call(client, "search_news", {
+                        "query": random.choice(self.queries), "limit": self.args.limit
+                    })
+                    if isinstance(articles, list):
+                        self.urls.extend(article["url"] for article in articles if article.get("url"))
+                else:
+                    await self.call(client, "fetch_article", {"url": random.choice(self.urls)})
+                
+                if self.args.think_time:
+                    await asyncio.sleep(random.expovariate(1 / self.args.think_time))
+    
+    async def run(self):
+        from fastmcp import Client
+        
+        # 메모리 전송에서는 먼저 끝난 클라이언트가 서버 수명 주기를 종료시키므로,
+        # 모든 클라이언트보다 오래 유지되는 연결을 하나 열어 둠
+        async with Client(self.mcp) as anchor:
+            deadline = time.perf_counter() + self.args.duration
+            started = time.perf_counter()
+            await asyncio.gather(*(self.client_loop(deadline) for _ in range(self.args.clients)))
+            elapsed = time.perf_counter() - started
+            
+            # 서버 측 통계 (캐시 적중률, 요청 병합 등)
+            stats = json.loads((await anchor.read_resource("news://stats"))[0].text)
+        return elapsed, stats
+
+def report(run, elapsed, stats, upstream):
+    total = sum(len(values) for values in run.latencies.values())
+    print(f"클라이언트 {run.args.clients}개, {elapsed:.1f}초, 도구 호출 {total}회 ({total / elapsed:.1f}회/초)")
+    print(f"{'도구':<16}{'호출':>8}{'오류':>8}{'회/초':>9}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'최대 ms':>10}")
+    
+    for name, values in sorted(run.latencies.items()):
+        values = sorted(values)
+        print(
+            f"{name:<16}{len(values):>8}{run.errors[name]:>8}{len(values) / elapsed:>9.1f}"
+            f"{percentile(values, 50) * 1000:>10.1f}{percentile(values, 90) * 1000:>10.1f}"
+            f"{percentile(values, 99) * 1000:>10.1f}{values[-1] * 1000:>10.1f}"
+        )
+    
+    print("\n업스트림 요청 수:")
+    for endpoint, count in sorted(upstream.counts.items()):
+        print(f"  {endpoint:<22}{count:>8}")
+    
+    print("\n서버 통계:")
+    for key in ("upstream", "search_cache", "article_store", "coalesced_requests", "retries", "circuit_breakers", "concurrency"):
+        if key in stats:
+            print(f"  {key}: {json.dumps(stats[key], ensure_ascii=False)}")
+
+async def main_async(args):
+    settings = StubSettings(
+        args.latency, args.jitter, args.error_rate, args.paragraphs, args.padding_kb, args.results
+    )
+    upstream = StubUpstream(settings, fox_port=args.fox_port, reuters_port=args.reuters_port)
+    await upstream.start()
+    
+    # config를 읽기 전에 크롤러가 대체 서버를 사용하도록 설정
+    os.environ.update(upstream.environment())
+    import config
+    config.RATE_LIMIT_RATE = args.upstream_rate
+    config.RATE_LIMIT_BURST = max(1, int(args.upstream_rate))
+    config.RATE_LIMIT_JITTER = 0
+    config.ARTICLE_STORE_PATH = os.path.join(args.data_dir, "articles.db")
+    config.SEARCH_INDEX_PATH = os.path.join(args.data_dir, "search_index.db")
+    config.WATCHLIST_PATH = os.path.join(args.data_dir, "watchlist.json")
+    from main import mcp
+    
+    # 도구의 진행/오류 메시지 로그와 경고는 출력하지 않음 (오류는 결과 표에서 집계)
+    logging.disable(logging.CRITICAL)
+    warnings.simplefilter("ignore")
+    
+    try:
+        run = LoadRun(mcp, args)
+        elapsed, stats = await run.run()
+        report(run, elapsed, stats, upstream)
+    finally:
+        await upstream.stop()
+
+def main():
+    """부하 테스트 실행 (python -m loadtest.run)"""
+    parser = argparse.ArgumentParser(description="대체 뉴스 서버를 사용한 MCP 도구 부하 테스트")
+    parser.add_argument("--clients", type=int, default=20, help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="실행 시간(초)")
+    parser.add_argument("--search-ratio", type=float, default=0.3, help="search_news 호출 비율 (나머지는 fetch_article)")
+    parser.add_argument("--queries", type=int, default=8, help="사용할 검색어 수 (적을수록 캐시 적중 증가)")
+    parser.add_argument("--limit", type=int, default=5, help="search_news의 limit")
+    parser.add_argument("--think-time", type=float, default=0.0, help="호출 사이 평균 대기(초)")
+    parser.add_argument("--upstream-rate", type=float, default=1000.0, help="호스트당 초당 요청 수 제한 (속도 제한 설정 대체)")
+    parser.add_argument("--latency", type=float, default=0.05, help="대체 서버 평균 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.5, help="응답 지연 무작위 비율")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="대체 서버 500 응답 비율")
+    parser.add_argument("--paragraphs", type=int, default=20, help="기사당 단락 수")
+    parser.add_argument("--padding-kb", type=int, default=40, help="기사 페이지의 본문 외 크기(KB)")
+    parser.add_argument("--results", type=int, default=100, help="검색어당 전체 검색 결과 수")
+    parser.add_argument("--fox-port", type=int, default=8801)
+    parser.add_argument("--reuters-port", type=int, default=8802)
+    parser.add_argument("--data-dir", default=None, help="기사 저장소/색인 경로 (기본: 임시 디렉터리)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        args.data_dir = args.data_dir or temp_dir
+        asyncio.run(main_async(args))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
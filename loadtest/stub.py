@@ -0,0 +1,227 @@
+# loadtest/stub.py
+import argparse
+import asyncio
+import json
+import random
+from collections import Counter
+from aiohttp import web
+
+# 기사 본문용 문장 (단락마다 몇 개씩 골라 사용)
+SENTENCES = [
+    "The Federal Reserve held its benchmark interest rate steady on Wednesday.",
+    "Officials signaled they still expect to cut borrowing costs later this year.",
+    "Markets rallied after the announcement and Treasury yields fell across the curve.",
+    "Consumer spending slowed in the second quarter while wage growth moderated.",
+    "Tesla shares fell after quarterly deliveries missed Wall Street estimates.",
+    "Oil prices climbed as tensions raised concerns about supply disruptions.",
+    "Negotiations over the spending bill will continue next week, officials said.",
+    "Emergency crews worked through the night to restore power to thousands of homes."
+]
+
+class StubSettings:
+    """대체 서버 응답 설정"""
+    
+    def __init__(self, latency=0.05, jitter=0.5, error_rate=0.0, paragraphs=20, padding_kb=40, results=100):
+        self.latency = latency        # 평균 응답 지연(초)
+        self.jitter = jitter          # 지연 시간에 더하는 무작위 비율
+        self.error_rate = error_rate  # 500 응답 비율
+        self.paragraphs = paragraphs  # 기사당 단락 수
+        self.padding_kb = padding_kb  # 기사 페이지의 스크립트/내비게이션 크기(KB)
+        self.results = results        # 검색어당 전체 검색 결과 수
+
+class StubUpstream:
+    """
+    Fox News(moxie 검색 API, 기사 페이지)와 Reuters(articles-by-search-v2, 기사 페이지)를
+    흉내 내는 로컬 서버 (소스별로 다른 포트)
+    """
+    
+    def __init__(self, settings=None, host="127.0.0.1", fox_port=8801, reuters_port=8802):
+        self.settings = settings or StubSettings()
+        self.host = host
+        self.fox_port = fox_port
+        self.reuters_port = reuters_port
+        self.counts = Counter()  # 엔드포인트별 요청 수
+        self._runners = []
+    
+    @property
+    def fox_url(self):
+        return f"http://{self.host}:{self.fox_port}"
+    
+    @property
+    def reuters_url(self):
+        return f"http://{self.host}:{self.reuters_port}"
+    
+    def environment(self):
+        """크롤러가 이 서버를 사용하도록 하는 환경 변수 (config 로드 전에 설정)"""
+        return {
+            "FOX_SITE_URL": self.fox_url,
+            "FOX_SEARCH_URL": f"{self.fox_url}/search/web",
+            "REUTERS_SITE_URL": self.reuters_url,
+            "REUTERS_SEARCH_URL": f"{self.reuters_url}/pf/api/v3/content/fetch/articles-by-search-v2"
+        }
+    
+    async def start(self):
+        fox_app = web.Application()
+        fox_app.router.add_get("/search/web", self.fox_search)
+        fox_app.router.add_get("/{path:.*}", self.fox_article)
+        
+        reuters_app = web.Application()
+        reuters_app.router.add_get("/pf/api/v3/content/fetch/articles-by-search-v2", self.reuters_search)
+        reuters_app.router.add_get("/{path:.*}", self.reuters_article)
+        
+        for app, port in ((fox_app, self.fox_port), (reuters_app, self.reuters_port)):
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            await web.TCPSite(runner, self.host, port).start()
+            self._runners.append(runner)
+    
+    async def stop(self):
+        for runner in self._runners:
+            await runner.cleanup()
+        self._runners = []
+    
+    async def _delay_or_error(self, endpoint):
+        """설정된 지연 후, error_rate 확률로 500 응답 반환 (정상이면 None)"""
+        self.counts[endpoint] += 1
+        settings = self.settings
+        await asyncio.sleep(settings.latency * (1 + random.uniform(-settings.jitter, settings.jitter)))
+        
+        if random.random() < settings.error_rate:
+            self.counts[f"{endpoint}_error"] += 1
+            return web.Response(status=500, text="stub error")
+        return None
+    
+    def _date(self, n):
+        """n번째 결과의 게시 시간 (번호가 클수록 오래된 기사)"""
+        return f"2024-06-{30 - min(n // 24, 29):02d}T{23 - n % 24:02d}:00:00Z"
+    
+    async def fox_search(self, request):
+        error = await self._delay_or_error("fox_search")
+        if error:
+            return error
+        
+        query = request.query.get("q", "")
+        start = int(request.query.get("start", 1))
+        data = []
+        for n in range(start, min(start + 10, self.settings.results + 1)):
+            data.append({
+                "type": "article",
+                "attributes": {
+                    "title": f"{query.title()} story {n}: {SENTENCES[n % len(SENTENCES)]}",
+                    "description": SENTENCES[(n + 3) % len(SENTENCES)],
+                    "canonical_url": f"{self.fox_url}/politics/{query}-story-{n}",
+                    "thumbnail": f"{self.fox_url}/static/{n}.jpg",
+                    "publication_date": self._date(n),
+                    "section": "politics"
+                }
+            })
+        
+        links = {}
+        if start + 10 <= self.settings.results:
+            links["next"] = f"{self.fox_url}/search/web?fields=web&q={query}&start={start + 10}"
+        return web.json_response({"data": data, "links": links})
+    
+    async def reuters_search(self, request):
+        error = await self._delay_or_error("reuters_search")
+        if error:
+            return error
+        
+        query = json.loads(request.query.get("query", "{}"))
+        keyword = query.get("keyword", "")
+        offset = query.get("offset", 0)
+        articles = []
+        for n in range(offset, min(offset + query.get("size", 20), self.settings.results)):
+            articles.append({
+                "title": f"{keyword.title()} report {n}: {SENTENCES[(n + 1) % len(SENTENCES)]}",
+                "description": SENTENCES[(n + 5) % len(SENTENCES)],
+                "canonical_url": f"/world/{keyword}-report-{n}/",
+                "thumbnail": {"url": f"{self.reuters_url}/resizer/{n}.jpg"},
+                "published_time": self._date(n),
+                "category": "world"
+            })
+        return web.json_response({"result": {"articles": articles}})
+    
+    def _paragraphs(self, path):
+        rng = random.Random(path)
+        return [" ".join(rng.sample(SENTENCES, 3)) for _ in range(self.settings.paragraphs)]
+    
+    def _padding(self):
+        return "var stub=1;" * (self.settings.padding_kb * 1024 // 11)
+    
+    def _article_response(self, request, html):
+        # 조건부 요청 지원 (경로가 같으면 내용도 같음)
+        etag = f'"{abs(hash(request.path))}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        return web.Response(text=html, content_type="text/html", headers={"ETag": etag})
+    
+    async def fox_article(self, request):
+        error = await self._delay_or_error("fox_article")
+        if error:
+            return error
+        
+        path = request.path
+        body = "".join(
+            f'<p>{text} <a href="/politics/related-{i}">Related</a></p>'
+            for i, text in enumerate(self._paragraphs(path))
+        )
+        html = f"""<!DOCTYPE html><html><head><script>{self._padding()}</script></head><body>
+<div class="article-meta article-meta-upper"><span class="eyebrow"><a href="/politics">Politics</a></span></div>
+<h1 class="headline speakable">Headline for {path}</h1>
+<h2 class="sub-headline speakable">{SENTENCES[len(path) % len(SENTENCES)]}</h2>
+<div class="author-byline"><span>By <a href="/person/stub">Stub Author</a></span></div>
+<span class="article-date"><time>June 1, 2024 10:00am EDT</time></span>
+<div class="article-body">{body}<blockquote><p class="quote-text">Stub quote.</p></blockquote></div>
+<footer>{self._padding()}</footer></body></html>"""
+        return self._article_response(request, html)
+    
+    async def reuters_article(self, request):
+        error = await self._delay_or_error("reuters_article")
+        if error:
+            return error
+        
+        path = request.path
+        body = "".join(
+            f'<div data-testid="paragraph-{i}">{text} <a data-testid="Link" href="/world/related-{i}/">Related</a></div>'
+            for i, text in enumerate(self._paragraphs(path))
+        )
+        html = f"""<!DOCTYPE html><html><head><script>{self._padding()}</script></head><body>
+<h1 data-testid="Heading">Headline for {path}</h1>
+<time datetime="2024-06-01T12:00:00Z">June 1</time><a rel="author" href="/authors/stub/">Stub Writer</a>
+<div data-testid="ArticleBody">{body}</div>
+<footer>{self._padding()}</footer></body></html>"""
+        return self._article_response(request, html)
+
+async def serve(upstream):
+    await upstream.start()
+    print("대체 서버 실행 중. 다음 환경 변수로 MCP 서버를 실행하세요:")
+    for name, value in upstream.environment().items():
+        print(f"  {name}={value}")
+    
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await upstream.stop()
+
+def main():
+    """대체 서버만 단독 실행 (python -m loadtest.stub)"""
+    parser = argparse.ArgumentParser(description="뉴스 소스 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--fox-port", type=int, default=8801)
+    parser.add_argument("--reuters-port", type=int, default=8802)
+    parser.add_argument("--latency", type=float, default=0.05, help="평균 응답 지연(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--paragraphs", type=int, default=20, help="기사당 단락 수")
+    parser.add_argument("--padding-kb", type=int, default=40, help="기사 페이지의 본문 외 크기(KB)")
+    args = parser.parse_args()
+    
+    settings = StubSettings(args.latency, error_rate=args.error_rate, paragraphs=args.paragraphs, padding_kb=args.padding_kb)
+    upstream = StubUpstream(settings, args.host, args.fox_port, args.reuters_port)
+    try:
+        asyncio.run(serve(upstream))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,30 @@ from fastmcp import FastMCP
 from tools.search import register_search_tools
 from tools.fetch import register_fetch_tools
 from tools.analysis import register_analysis_tools
+from tools.store import register_store_tools
+from tools.watch import register_watch_tools
 from resources.sources import register_sources
 from resources.stats import register_stats
+from resources.traces import register_traces
 from prompts.templates import register_prompts
+from lifespan import server_lifespan
+from utils.metrics import instrument_tools
 
 # MCP 서버 생성
-mcp = FastMCP(name="News Crawler")
+mcp = FastMCP(name="News Crawler", lifespan=server_lifespan)
+
+# 등록되는 모든 도구의 호출 수, 오류 수, 실행 시간 기록
+instrument_tools(mcp)
 
 # 도구, 리소스, 프롬프트 등록
 register_search_tools(mcp)
 register_fetch_tools(mcp)
 register_analysis_tools(mcp)
+register_store_tools(mcp)
+register_watch_tools(mcp)
 register_sources(mcp)
 register_stats(mcp)
+register_traces(mcp)
 register_prompts(mcp)
 
 # 서버 실행
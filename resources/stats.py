@@ -1,8 +1,19 @@
 # resources/stats.py
 from fastmcp import Context
 import time
+from utils.cache import search_cache
+from storage.article_store import article_store
+from crawlers.base_crawler import inflight, concurrency_limiter
+from crawlers.resilience import retry_policy, breakers
+from utils.keywords import keyword_index
+from storage.search_index import search_index
+from utils.similarity import headline_index, body_index
+from utils.metrics import metrics
+from utils.tracing import tracer
+from crawlers.watchlist import watchlist
+from config import METRICS_PROMETHEUS
 
-# 통계 추적을 위한 전역 변수
+# 통계 추적을 위한 전역 변수 (update_stats 도구로 직접 더한 값, 도구 호출 수는 자동 집계와 합산)
 usage_stats = {
     "search_count": 0,
     "fetch_count": 0,
@@ -17,8 +28,11 @@ def register_stats(mcp):
     async def get_stats(ctx: Context = None) -> dict:
         """크롤링 통계 정보를 제공합니다."""
         
-        # 도구 사용 통계 복사
+        # 도구 사용 통계 (자동 집계된 호출 수 반영)
         stats = dict(usage_stats)
+        stats["search_count"] += metrics.calls("search_news")
+        stats["fetch_count"] += metrics.calls("fetch_article") + metrics.calls("batch_fetch_articles")
+        stats["analysis_count"] += metrics.calls("analyze_article")
         
         # 가동 시간 계산
         uptime = time.time() - stats["last_reset"]
@@ -36,8 +50,55 @@ def register_stats(mcp):
         # 총 사용량
         stats["total_requests"] = stats["search_count"] + stats["fetch_count"] + stats["analysis_count"]
         
+        # 도구별 호출/오류 수와 실행 시간, 호스트별 요청 수/상태 코드/다운로드 크기/응답 시간
+        stats.update(metrics.snapshot())
+        
+        # 검색 캐시 적중률
+        stats["search_cache"] = search_cache.stats()
+        
+        # 기사 저장소 상태
+        stats["article_store"] = await article_store.stats()
+        
+        # 동시 요청 병합 현황
+        stats["coalesced_requests"] = inflight.stats()
+        
+        # 재시도/헤지 요청 수와 호스트별 회로 차단기 상태
+        stats["retries"] = retry_policy.stats()
+        stats["circuit_breakers"] = breakers.stats()
+        
+        # 호스트별 적응형 동시 요청 상한과 조절 기록
+        stats["concurrency"] = concurrency_limiter.stats()
+        
+        # 키워드 문서 빈도 색인 크기
+        stats["keyword_index"] = keyword_index.stats()
+        stats["search_index"] = await search_index.stats()
+        stats["duplicate_detection"] = {"headlines": headline_index.stats(), "bodies": body_index.stats()}
+        stats["tracing"] = tracer.stats()
+        stats["watchlist"] = watchlist.stats()
+        
         return stats
     
+    if METRICS_PROMETHEUS:
+        @mcp.resource("news://metrics", mime_type="text/plain")
+        async def get_metrics(ctx: Context = None) -> str:
+            """도구/업스트림 지표를 Prometheus 텍스트 형식으로 제공합니다."""
+            cache = search_cache.stats()
+            requests = inflight.stats()
+            gauges = {
+                "news_search_cache_hit_ratio": ("검색 캐시 적중률", cache["hit_rate"]),
+                "news_search_cache_entries": ("검색 캐시 항목 수", cache["entries"]),
+                "news_article_revalidated_total": ("조건부 요청으로 재사용한 저장 기사 수", article_store.counters["revalidated"]),
+                "news_article_misses_total": ("새로 다운로드한 기사 수", article_store.counters["misses"]),
+                "news_coalesced_requests_total": ("진행 중인 요청에 합류한 요청 수", requests["shared"]),
+                "news_upstream_retries_total": ("업스트림 요청 재시도 수", retry_policy.counters["retries"]),
+                "news_upstream_hedged_total": ("헤지 요청 수", retry_policy.counters["hedged"]),
+                "news_circuit_open_hosts": (
+                    "회로 차단기가 열린 호스트 수",
+                    sum(1 for breaker in breakers.breakers.values() if breaker.state == "open")
+                )
+            }
+            return metrics.prometheus(gauges)
+    
     # 통계 업데이트 함수 추가
     # 도구 데코레이터 옵션으로 설정하거나 별도 함수로 구현
     @mcp.tool("update_stats")
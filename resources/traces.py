@@ -0,0 +1,16 @@
+# resources/traces.py
+from fastmcp import Context
+from utils.tracing import tracer
+
+def register_traces(mcp):
+    """트레이스 리소스 등록"""
+    
+    @mcp.resource("news://traces")
+    async def get_traces(ctx: Context = None) -> dict:
+        """최근 샘플링된 도구 호출의 스팬 트리를 느린 순서로 제공합니다."""
+        result = tracer.stats()
+        if not tracer.enabled:
+            result["note"] = "트레이싱이 꺼져 있습니다. TRACE_SAMPLE_RATE 환경 변수를 0보다 크게 설정하세요."
+        
+        result["traces"] = tracer.slowest()
+        return result
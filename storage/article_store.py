@@ -0,0 +1,222 @@
+# storage/article_store.py
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from config import ARTICLE_STORE_PATH, ARTICLE_STORE_MAX_BYTES
+from storage.search_index import search_index
+from utils.parsing import canonicalize_url
+
+class ArticleStore:
+    """파싱된 기사를 정규화된 URL 기준으로 저장하는 SQLite 저장소"""
+    
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._lock = threading.Lock()
+        self.counters = {"revalidated": 0, "misses": 0, "stale_served": 0, "evictions": 0}
+    
+    def _connect(self):
+        """최초 사용 시 DB 연결 및 테이블 생성"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    url TEXT PRIMARY KEY,
+                    source TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    data TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles(accessed_at)")
+            self._conn.commit()
+        return self._conn
+    
+    def get_sync(self, url):
+        """저장된 기사와 검증자(ETag, Last-Modified) 조회"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT data, etag, last_modified, fetched_at FROM articles WHERE url = ?",
+                (canonicalize_url(url),)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        
+        data, etag, last_modified, fetched_at = row
+        return {
+            "article": json.loads(data),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at
+        }
+    
+    def put_sync(self, url, article, etag=None, last_modified=None):
+        """기사 저장 후 용량 초과 시 오래 사용되지 않은 기사부터 제거"""
+        data = json.dumps(article, ensure_ascii=False)
+        now = time.time()
+        source = article.get("metadata", {}).get("source", "")
+        
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (canonicalize_url(url), source, etag, last_modified, data, len(data.encode("utf-8")), now, now)
+            )
+            self._evict(conn)
+            conn.commit()
+    
+    def touch_sync(self, url):
+        """재검증된 기사의 사용 시각 갱신"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE articles SET accessed_at = ? WHERE url = ?",
+                (time.time(), canonicalize_url(url))
+            )
+            conn.commit()
+    
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        rows = conn.execute("SELECT url, size FROM articles ORDER BY accessed_at").fetchall()
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM articles WHERE url = ?", (url,))
+            total -= size
+            self.counters["evictions"] += 1
+    
+    def iter_articles_sync(self, batch_size=200):
+        """저장된 모든 기사를 배치 단위로 읽어 순서대로 반환 (도중에 저장소가 닫히면 중단)"""
+        with self._lock:
+            conn = self._connect()
+        
+        last_url = ""
+        while True:
+            with self._lock:
+                if self._conn is not conn:
+                    return
+                rows = conn.execute(
+                    "SELECT url, data FROM articles WHERE url > ? ORDER BY url LIMIT ?",
+                    (last_url, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            
+            for url, data in rows:
+                yield json.loads(data)
+            last_url = rows[-1][0]
+    
+    def purge_sync(self, older_than_days=None, source=None):
+        """조건에 맞는 기사 삭제 (조건이 없으면 전체 삭제) 후 삭제한 기사의 정규화된 URL 목록 반환"""
+        conditions = []
+        params = []
+        if older_than_days is not None:
+            conditions.append("fetched_at < ?")
+            params.append(time.time() - older_than_days * 86400)
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        with self._lock:
+            conn = self._connect()
+            deleted = [row[0] for row in conn.execute("SELECT url FROM articles" + where, params)]
+            conn.execute("DELETE FROM articles" + where, params)
+            conn.commit()
+            conn.execute("VACUUM")
+        return deleted
+    
+    def stats_sync(self):
+        """저장소 통계"""
+        with self._lock:
+            count, total, oldest, newest = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(fetched_at), MAX(fetched_at) FROM articles"
+            ).fetchone()
+            by_source = dict(self._connect().execute(
+                "SELECT source, COUNT(*) FROM articles GROUP BY source"
+            ).fetchall())
+        
+        return {
+            **self.counters,
+            "path": self.path,
+            "articles": count,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "by_source": by_source,
+            "oldest": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(oldest)) if oldest else None,
+            "newest": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(newest)) if newest else None
+        }
+    
+    # 이벤트 루프를 막지 않도록 DB 작업은 스레드에서 실행
+    async def get(self, url):
+        return await asyncio.to_thread(self.get_sync, url)
+    
+    async def put(self, url, article, etag=None, last_modified=None):
+        await asyncio.to_thread(self.put_sync, url, article, etag, last_modified)
+    
+    async def touch(self, url):
+        await asyncio.to_thread(self.touch_sync, url)
+    
+    async def purge(self, older_than_days=None, source=None):
+        return await asyncio.to_thread(self.purge_sync, older_than_days, source)
+    
+    async def stats(self):
+        return await asyncio.to_thread(self.stats_sync)
+    
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# 모든 크롤러가 공유하는 기사 저장소
+article_store = ArticleStore(ARTICLE_STORE_PATH, ARTICLE_STORE_MAX_BYTES)
+
+def main():
+    """저장소 확인/정리용 명령줄 도구"""
+    parser = argparse.ArgumentParser(description="기사 저장소 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    subparsers.add_parser("stats", help="저장소 통계 출력")
+    
+    show = subparsers.add_parser("show", help="저장된 기사 출력")
+    show.add_argument("url")
+    
+    purge = subparsers.add_parser("purge", help="저장된 기사 삭제")
+    purge.add_argument("--older-than", type=float, default=None, help="지정한 일수보다 오래된 기사만 삭제")
+    purge.add_argument("--source", default=None, help="지정한 소스의 기사만 삭제 (예: Reuters)")
+    
+    args = parser.parse_args()
+    if args.command == "stats":
+        result = article_store.stats_sync()
+    elif args.command == "show":
+        result = article_store.get_sync(args.url)
+    else:
+        # 삭제한 기사는 전문 색인에서도 제거
+        deleted = article_store.purge_sync(args.older_than, args.source)
+        result = {"deleted": len(deleted), "unindexed": search_index.remove_sync(deleted)}
+        search_index.close()
+    
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    article_store.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+# storage/search_index.py
+import asyncio
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from config import SEARCH_INDEX_PATH
+from utils.keywords import TAG_PATTERN
+from utils.parsing import canonicalize_url, normalize_date
+
+logger = logging.getLogger(__name__)
+
+# FTS5 검색어로 쓸 단어 추출
+QUERY_TOKEN_PATTERN = re.compile(r"\w+")
+
+class SearchIndex:
+    """가져온 기사의 제목, 부제목, 본문, 인용문에 대한 SQLite FTS5 전문 색인"""
+    
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self.pending_writes = 0  # 마지막 압축 이후 변경 수
+    
+    def _connect(self):
+        """최초 사용 시 DB 연결 및 테이블 생성"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT UNIQUE NOT NULL,
+                    source TEXT,
+                    published TEXT,
+                    headline TEXT,
+                    indexed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_published ON documents(published)")
+            self._conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                    headline, subheadline, body, quotes,
+                    tokenize = 'porter unicode61'
+                )
+            """)
+            self._conn.commit()
+            self._closed = False
+        return self._conn
+    
+    def add_article_sync(self, article):
+        """기사를 색인에 추가 (같은 URL은 최신 내용으로 교체)"""
+        metadata = article.get("metadata", {})
+        url = metadata.get("url")
+        if not url:
+            return
+        
+        body = []
+        quotes = []
+        for item in article.get("content", []):
+            if item.get("type") in ("text", "subheading"):
+                body.append(TAG_PATTERN.sub("", item.get("content", "")))
+            elif item.get("type") == "quote":
+                quotes.append(item.get("content", ""))
+        
+        headline = metadata.get("headline", "")
+        published = normalize_date(metadata.get("published_date", ""))
+        
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT id FROM documents WHERE url = ?", (url,)).fetchone()
+            if row:
+                doc_id = row[0]
+                conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+                conn.execute(
+                    "UPDATE documents SET source = ?, published = ?, headline = ?, indexed_at = ? WHERE id = ?",
+                    (metadata.get("source", ""), published, headline, time.time(), doc_id)
+                )
+            else:
+                doc_id = conn.execute(
+                    "INSERT INTO documents (url, source, published, headline, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                    (url, metadata.get("source", ""), published, headline, time.time())
+                ).lastrowid
+            
+            conn.execute(
+                "INSERT INTO documents_fts (rowid, headline, subheadline, body, quotes) VALUES (?, ?, ?, ?, ?)",
+                (doc_id, headline, metadata.get("subheadline", ""), "\n".join(body), "\n".join(quotes))
+            )
+            conn.commit()
+            self.pending_writes += 1
+    
+    def add_articles_sync(self, articles):
+        """여러 기사를 색인에 추가 (도중에 색인이 닫히면 중단)"""
+        for article in articles:
+            if self._closed:
+                break
+            self.add_article_sync(article)
+    
+    def remove_sync(self, urls):
+        """기사 저장소에서 삭제한 기사(정규화된 URL)를 색인에서 제거 후 제거 건수 반환"""
+        urls = set(urls)
+        if not urls:
+            return 0
+        
+        with self._lock:
+            conn = self._connect()
+            # 색인에는 기사 메타데이터의 URL 그대로 저장되므로 정규화해 비교
+            ids = [
+                (doc_id,) for doc_id, url in conn.execute("SELECT id, url FROM documents")
+                if canonicalize_url(url) in urls
+            ]
+            conn.executemany("DELETE FROM documents_fts WHERE rowid = ?", ids)
+            conn.executemany("DELETE FROM documents WHERE id = ?", ids)
+            conn.commit()
+            self.pending_writes += len(ids)
+        return len(ids)
+    
+    def search_sync(self, query, source=None, since=None, until=None, limit=5):
+        """검색어와 일치하는 기사를 관련도순으로 반환 (모든 단어 일치 우선, 없으면 일부 일치)"""
+        terms = QUERY_TOKEN_PATTERN.findall(query)
+        if not terms:
+            return []
+        
+        quoted = [f'"{term}"' for term in terms]
+        results = self._search(" AND ".join(quoted), source, since, until, limit)
+        if not results and len(terms) > 1:
+            results = self._search(" OR ".join(quoted), source, since, until, limit)
+        return results
+    
+    def _search(self, match, source, since, until, limit):
+        conditions = ["documents_fts MATCH ?"]
+        params = [match]
+        if source:
+            conditions.append("d.source = ?")
+            params.append(source)
+        if since:
+            conditions.append("d.published >= ?")
+            params.append(since)
+        if until:
+            # 날짜만 지정한 경우 그날 전체 포함
+            conditions.append("d.published <= ?")
+            params.append(until + " 23:59:59" if len(until) == 10 else until)
+        params.append(limit)
+        
+        # 제목 > 부제목 > 인용문 > 본문 순으로 가중치
+        sql = f"""
+            SELECT d.url, d.source, d.published, d.headline,
+                   snippet(documents_fts, -1, '[', ']', '…', 16),
+                   bm25(documents_fts, 5.0, 3.0, 1.0, 2.0) AS rank
+            FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid
+            WHERE {" AND ".join(conditions)}
+            ORDER BY rank
+            LIMIT ?
+        """
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        
+        return [
+            {
+                "title": headline,
+                "url": url,
+                "source": source_name,
+                "date": published,
+                "snippet": snippet,
+                "score": round(-rank, 4)
+            }
+            for url, source_name, published, headline, snippet, rank in rows
+        ]
+    
+    def count_sync(self):
+        """색인된 기사 수"""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+    
+    def optimize_sync(self):
+        """FTS 세그먼트 병합(압축) 후 처리한 변경 수 반환"""
+        with self._lock:
+            if self.pending_writes == 0:
+                return 0
+            
+            conn = self._connect()
+            conn.execute("INSERT INTO documents_fts(documents_fts) VALUES ('optimize')")
+            conn.commit()
+            merged, self.pending_writes = self.pending_writes, 0
+        return merged
+    
+    # 이벤트 루프를 막지 않도록 DB 작업은 스레드에서 실행
+    async def add_article(self, article):
+        await asyncio.to_thread(self.add_article_sync, article)
+    
+    async def remove(self, urls):
+        return await asyncio.to_thread(self.remove_sync, urls)
+    
+    async def search(self, query, source=None, since=None, until=None, limit=5):
+        return await asyncio.to_thread(self.search_sync, query, source, since, until, limit)
+    
+    async def stats(self):
+        return {"documents": await asyncio.to_thread(self.count_sync), "pending_writes": self.pending_writes}
+    
+    async def run_compaction(self, interval):
+        """주기적으로 변경이 있으면 색인을 압축 (서버 수명 주기 동안 실행)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.optimize_sync)
+            except sqlite3.Error as e:
+                logger.warning("검색 색인 압축 중 오류: %s", e)
+    
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._closed = True
+
+# 로컬 기사 보관소 검색용 공유 색인
+search_index = SearchIndex(SEARCH_INDEX_PATH)
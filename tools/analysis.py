@@ -1,53 +1,64 @@
 # tools/analysis.py
 import re
-from collections import Counter
 from fastmcp import Context
-from config import ENGLISH_STOPWORDS, MAX_KEYWORDS
+from config import MAX_KEYWORDS, KEYWORD_METHOD
+from utils.keywords import keyword_index, TAG_PATTERN
+from utils.tracing import tracer
+
+# 문장 분리용 정규식
+SENTENCE_PATTERN = re.compile(r'[.!?]+')
 
 def register_analysis_tools(mcp):
     """분석 관련 도구 등록"""
     
     @mcp.tool()
-    async def extract_keywords(text: str, count: int = 5, ctx: Context = None) -> list:
+    async def extract_keywords(text: str, count: int = 5, method: str = KEYWORD_METHOD, bigrams: bool = True, ctx: Context = None) -> list:
         """
         텍스트에서 주요 키워드를 추출합니다.
         
+        지금까지 가져온 기사 전체의 문서 빈도를 반영하여, 모든 기사에 흔한 단어보다
+        이 텍스트에 특징적인 단어에 높은 점수를 줍니다.
+        
         Args:
             text: 분석할 텍스트
             count: 추출할 키워드 수
+            method: 점수 방식 (tfidf, bm25)
+            bigrams: 두 단어 구문 포함 여부
             
         Returns:
-            주요 키워드 목록
+            주요 키워드 목록 (단어, 출현 횟수, 점수)
         """
         if ctx:
             await ctx.info(f"텍스트에서 키워드 {count}개를 추출합니다...")
         
-        # 텍스트 정제
-        text = text.lower()
-        # HTML 태그 제거
-        text = re.sub(r'<.*?>', '', text)
-        # 특수 문자 제거
-        text = re.sub(r'[^\w\s]', '', text)
-        
-        # 단어 분리
-        words = text.split()
-        
-        # 불용어 제거
-        words = [word for word in words if word not in ENGLISH_STOPWORDS and len(word) > 2]
-        
-        # 빈도수 계산
-        word_freq = Counter(words)
-        
-        # 상위 키워드 추출
-        keywords = word_freq.most_common(min(count, MAX_KEYWORDS))
-        
-        result = [{"word": word, "count": count} for word, count in keywords]
+        with tracer.span("keyword_scoring", chars=len(text)):
+            result = keyword_index.score(text, min(count, MAX_KEYWORDS), method, bigrams)
         
         if ctx:
             await ctx.info(f"{len(result)}개의 키워드를 추출했습니다.")
         
         return result
     
+    @mcp.tool()
+    async def batch_extract_keywords(texts: list, count: int = 5, method: str = KEYWORD_METHOD, bigrams: bool = True, ctx: Context = None) -> list:
+        """
+        여러 텍스트의 주요 키워드를 한 번에 추출합니다.
+        
+        Args:
+            texts: 분석할 텍스트 목록
+            count: 텍스트별 추출할 키워드 수
+            method: 점수 방식 (tfidf, bm25)
+            bigrams: 두 단어 구문 포함 여부
+            
+        Returns:
+            입력 순서대로 각 텍스트의 키워드 목록
+        """
+        if ctx:
+            await ctx.info(f"{len(texts)}개 텍스트에서 키워드를 추출합니다...")
+        
+        with tracer.span("keyword_scoring", texts=len(texts)):
+            return keyword_index.score_many(texts, min(count, MAX_KEYWORDS), method, bigrams)
+    
     @mcp.tool()
     async def analyze_article(article_data: dict, ctx: Context = None) -> dict:
         """
@@ -67,22 +78,23 @@ def register_analysis_tools(mcp):
                 await ctx.error("유효하지 않은 기사 데이터입니다.")
             return {"error": "유효하지 않은 기사 데이터"}
         
-        # 전체 텍스트 추출
-        full_text = ""
-        for item in article_data["content"]:
-            if item["type"] in ["text", "quote", "subheading"]:
-                full_text += " " + item.get("content", "")
-        
-        # 텍스트 정제
-        full_text = re.sub(r'<.*?>', '', full_text)
-        
-        # 기본 통계
-        sentences = re.split(r'[.!?]+', full_text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        words = full_text.split()
+        with tracer.span("text_extraction"):
+            # 전체 텍스트 추출
+            full_text = ""
+            for item in article_data["content"]:
+                if item["type"] in ["text", "quote", "subheading"]:
+                    full_text += " " + item.get("content", "")
+            
+            # 텍스트 정제
+            full_text = TAG_PATTERN.sub('', full_text)
+            
+            # 기본 통계
+            sentences = SENTENCE_PATTERN.split(full_text)
+            sentences = [s.strip() for s in sentences if s.strip()]
+            words = full_text.split()
         
         # 키워드 추출
-        keywords = await extract_keywords(full_text, 10, ctx)
+        keywords = await extract_keywords(full_text, 10, ctx=ctx)
         
         result = {
             "title": article_data["metadata"].get("headline", ""),
@@ -99,4 +111,4 @@ def register_analysis_tools(mcp):
         if ctx:
             await ctx.info("기사 분석을 완료했습니다.")
         
-        return result
\ No newline at end of file
+        return result
@@ -1,22 +1,37 @@
 # tools/fetch.py
+import asyncio
+import contextlib
 from fastmcp import Context
-from crawlers.fox_crawler import FoxCrawler
-from crawlers.reuters_crawler import ReutersCrawler
+from crawlers import get_crawler
+from config import DEFAULT_TOOL_BUDGET
+from utils.async_helpers import cancel_and_wait, deadline_scope, time_remaining
+from utils.keywords import keyword_index
+from storage.search_index import search_index
+from utils.parsing import canonicalize_url
+from utils.similarity import MinHashIndex, body_index, headline_index, add_article_body
+from utils.tracing import tracer
 
-# 크롤러 인스턴스 생성
-fox_crawler = FoxCrawler()
-reuters_crawler = ReutersCrawler()
+async def index_article(article_data):
+    """가져온 기사를 메모리/로컬 색인에 반영 (관심 검색어 미리 가져오기에서도 사용)"""
+    with tracer.span("indexing"):
+        # 키워드 점수 계산용 문서 빈도 색인에 반영
+        keyword_index.add_article(article_data)
+        # 로컬 보관소 검색용 전문 색인에 추가
+        await search_index.add_article(article_data)
+        # 중복 본문 감지용 서명 색인에 추가
+        add_article_body(article_data)
 
 def register_fetch_tools(mcp):
     """기사 가져오기 관련 도구 등록"""
     
     @mcp.tool()
-    async def fetch_article(url: str, ctx: Context = None) -> dict:
+    async def fetch_article(url: str, budget: float = DEFAULT_TOOL_BUDGET, ctx: Context = None) -> dict:
         """
         특정 URL에서 뉴스 기사의 전체 내용을 가져옵니다.
         
         Args:
             url: 뉴스 기사 URL
+            budget: 제한 시간(초, 0이면 제한 없음)
             
         Returns:
             기사 내용이 포함된 사전 (제목, 본문, 날짜, 이미지 등)
@@ -25,24 +40,29 @@ def register_fetch_tools(mcp):
             await ctx.info(f"기사 내용을 가져오는 중: {url}")
         
         # URL에 따라 적절한 크롤러 선택
-        if "foxnews.com" in url:
-            if ctx:
-                await ctx.info("Fox News 기사 분석 중...")
-            article_data = await fox_crawler.fetch_article_details(url)
-        elif "reuters.com" in url:
-            if ctx:
-                await ctx.info("Reuters 기사 분석 중...")
-            article_data = await reuters_crawler.fetch_article_details(url)
-        else:
+        crawler = get_crawler(url)
+        if crawler is None:
             if ctx:
                 await ctx.error("지원되지 않는 뉴스 소스입니다.")
             return {"error": "지원되지 않는 뉴스 소스"}
         
+        if ctx:
+            await ctx.info(f"{crawler.name} 기사 분석 중...")
+        try:
+            with deadline_scope(budget):
+                article_data = await asyncio.wait_for(crawler.fetch_article_details(url), time_remaining())
+        except asyncio.TimeoutError:
+            if ctx:
+                await ctx.error("제한 시간 안에 기사를 가져오지 못했습니다.")
+            return {"error": "제한 시간 초과"}
+        
         if not article_data:
             if ctx:
                 await ctx.error("기사 내용을 가져오지 못했습니다.")
             return {"error": "기사 내용을 가져오지 못했습니다."}
         
+        await index_article(article_data)
+        
         if ctx:
             headline = article_data["metadata"].get("headline", "")
             await ctx.info(f"기사 내용을 성공적으로 가져왔습니다: {headline}")
@@ -50,32 +70,97 @@ def register_fetch_tools(mcp):
         return article_data
     
     @mcp.tool()
-    async def batch_fetch_articles(urls: list, ctx: Context = None) -> list:
+    async def batch_fetch_articles(urls: list, concurrency: int = 0, dedupe: bool = True,
+                                   budget: float = DEFAULT_TOOL_BUDGET, ctx: Context = None) -> list | dict:
         """
         여러 URL에서 뉴스 기사의 내용을 일괄 가져옵니다.
         
         Args:
             urls: 뉴스 기사 URL 목록
+            concurrency: 소스별 최대 동시 요청 수 (0이면 사이트 응답에 맞춰 조절되는 호스트별 제한만 적용)
+            dedupe: 거의 같은 기사를 {"url", "duplicate_of"}로 대신할지 여부 (False면 모든 URL의 내용을 반환)
+            budget: 전체 제한 시간(초, 0이면 제한 없음)
             
         Returns:
-            각 기사 내용이 포함된 목록
+            입력 순서대로 정렬된 기사 목록 (실패한 URL은 {"url", "error"},
+            dedupe면 앞선 기사와 거의 같은 기사는 {"url", "duplicate_of"} 항목).
+            제한 시간 안에 끝나지 않은 URL이 있으면 요청을 취소하고
+            {"articles": 끝난 기사 목록, "partial": true, "incomplete": 끝나지 않은 URL 목록}
         """
         if ctx:
             await ctx.info(f"{len(urls)}개의 기사를 가져오는 중...")
         
-        results = []
         total = len(urls)
+        results = [None] * total
+        semaphores = {}  # 소스별 동시 요청 제한 (concurrency를 지정한 경우)
+        keys = [canonicalize_url(url) for url in urls]
         
-        for i, url in enumerate(urls):
-            if ctx:
-                progress = (i / total) * 100
-                await ctx.report_progress(progress, f"{i+1}/{total} 기사 처리 중")
+        # 검색 결과의 제목+요약이 앞선 URL과 거의 같으면 가져오지 않음
+        if dedupe:
+            batch_headlines = MinHashIndex()
+            first_url = {}
+            for index, key in enumerate(keys):
+                first_url.setdefault(key, urls[index])
+                signature = headline_index.get(key)
+                matches = batch_headlines.find(signature, exclude=key)
+                if matches:
+                    results[index] = {"url": urls[index], "duplicate_of": first_url[matches[0][0]]}
+                else:
+                    batch_headlines.add(key, signature)
+        
+        async def fetch_one(index, url):
+            # 동시 요청 수는 크롤러의 호스트별 적응형 제한이 조절하며, concurrency는 추가 상한
+            semaphore = None
+            if concurrency > 0:
+                semaphore = semaphores.setdefault(get_crawler(url), asyncio.Semaphore(concurrency))
+            async with semaphore or contextlib.nullcontext():
+                try:
+                    with tracer.span("fetch_article", url=url):
+                        article = await fetch_article(url, ctx=ctx)
+                except Exception as e:
+                    article = {"error": str(e)}
+            return index, url, article
+        
+        with deadline_scope(budget):
+            tasks = [asyncio.create_task(fetch_one(i, url)) for i, url in enumerate(urls) if results[i] is None]
+            completed = total - len(tasks)
+            
+            # 완료되는 순서대로 진행률 보고, 마감 시각이 지나면 남은 요청 취소
+            try:
+                for next_done in asyncio.as_completed(tasks, timeout=time_remaining()):
+                    index, url, article = await next_done
+                    if "error" in article:
+                        article = {"url": url, "error": article["error"]}
+                    results[index] = article
+                    
+                    completed += 1
+                    if ctx:
+                        await ctx.report_progress(completed, total)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                await cancel_and_wait(tasks)
+        
+        # 본문이 앞선 기사와 거의 같으면 중복으로 표시 (응답 크기 절약)
+        kept = {}
+        for index, article in enumerate(results):
+            if not dedupe or article is None or "metadata" not in article:
+                continue
             
-            article = await fetch_article(url, ctx)
-            if "error" not in article:
-                results.append(article)
+            matches = body_index.find(body_index.get(keys[index]), exclude=keys[index])
+            duplicate = next((kept[key] for key, _ in matches if key in kept), None)
+            if duplicate:
+                results[index] = {"url": urls[index], "duplicate_of": duplicate}
+            else:
+                kept.setdefault(keys[index], urls[index])
         
+        incomplete = [url for url, article in zip(urls, results) if article is None]
         if ctx:
-            await ctx.info(f"{len(results)}개 기사를 성공적으로 가져왔습니다.")
+            succeeded = sum(1 for article in results if article is not None and "error" not in article)
+            await ctx.info(f"{succeeded}/{total}개 기사를 성공적으로 가져왔습니다.")
+            if incomplete:
+                await ctx.warning(f"제한 시간 안에 끝나지 않은 기사 {len(incomplete)}개")
         
-        return results
\ No newline at end of file
+        if incomplete:
+            return {"articles": [article for article in results if article is not None], "partial": True, "incomplete": incomplete}
+        return results
@@ -1,58 +1,267 @@
 # tools/search.py
 import asyncio
+import base64
+import heapq
+import json
+from itertools import islice
 from fastmcp import Context
-from crawlers.fox_crawler import FoxCrawler
-from crawlers.reuters_crawler import ReutersCrawler
-from config import DEFAULT_LIMIT
+from crawlers import fox_crawler, reuters_crawler
+from config import DEFAULT_LIMIT, DEFAULT_TOOL_BUDGET
+from storage.search_index import search_index
+from utils.async_helpers import cancel_and_wait, deadline_scope, time_remaining
+from utils.cache import normalize_query
+from utils.parsing import canonicalize_url, date_timestamp
+from utils.similarity import MinHashIndex, headline_index, headline_signature
+from utils.tracing import tracer
 
-# 크롤러 인스턴스 생성
-fox_crawler = FoxCrawler()
-reuters_crawler = ReutersCrawler()
+# 도구의 source 값과 저장된 소스 이름 대응
+SOURCE_NAMES = {"fox": "Fox News", "reuters": "Reuters"}
+
+def merge_newest_first(streams, limit):
+    """최신순으로 정렬된 소스별 목록을 힙으로 병합하여 상위 limit개 반환"""
+    merged = heapq.merge(*streams, key=lambda x: x.get("date", ""), reverse=True)
+    return list(islice(merged, limit))
+
+def collapse_duplicates(articles, limit):
+    """
+    최신순 기사 목록에서 거의 같은 기사(소스 간 통신 기사 등)를 가장 최신 기사 하나로 묶어 상위 limit개 반환
+    
+    묶인 기사는 대표 기사의 "duplicates" 목록에 (제목, URL, 소스, 날짜)로 첨부
+    """
+    clusters = MinHashIndex()
+    representatives = {}
+    results = []
+    
+    for article in articles:
+        key = canonicalize_url(article.get("url", ""))
+        signature = headline_signature(article)
+        # 일괄 가져오기에서 중복 URL을 거를 수 있도록 서명 보관
+        headline_index.add(key, signature)
+        
+        matches = clusters.find(signature)
+        if matches:
+            representatives[matches[0][0]].setdefault("duplicates", []).append({
+                "title": article.get("title", ""),
+                "url": article.get("url", ""),
+                "source": article.get("source", ""),
+                "date": article.get("date", "")
+            })
+        elif len(results) < limit:
+            results.append(article)
+            representatives[key] = article
+            clusters.add(key, signature)
+    
+    return results
+
+def encode_cursor(state):
+    """커서 상태를 불투명한 문자열로 변환"""
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode()
+
+def decode_cursor(cursor):
+    """커서 문자열을 상태로 변환 (잘못된 커서면 None)"""
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        return None
+    if not isinstance(state, dict) or not isinstance(state.get("hw"), dict) or not isinstance(state.get("seen"), dict):
+        return None
+    return state
+
+def advance_cursor(state, articles):
+    """
+    소스별 기준 시각(hw)을 가져온 기사 중 가장 최근 게시 시간으로 올림
+    
+    기준 시각과 게시 시간이 같은 기사 URL은 seen에 보관하여 다음 호출에서 제외
+    """
+    for article in articles:
+        timestamp = date_timestamp(article.get("date"))
+        if timestamp is None:
+            continue
+        
+        source = article.get("source", "")
+        current = state["hw"].get(source)
+        if current is None or timestamp > current:
+            state["hw"][source] = timestamp
+            state["seen"][source] = [article.get("url", "")]
+        elif timestamp == current and article.get("url", "") not in state["seen"][source]:
+            state["seen"][source].append(article.get("url", ""))
 
 def register_search_tools(mcp):
     """검색 관련 도구 등록"""
     
     @mcp.tool()
-    async def search_news(query: str, source: str = "all", limit: int = DEFAULT_LIMIT, ctx: Context = None) -> list:
+    async def search_news(query: str, source: str = "all", limit: int = DEFAULT_LIMIT, cursor: str = None, stream: bool = False,
+                          budget: float = DEFAULT_TOOL_BUDGET, ctx: Context = None) -> list | dict:
         """
         뉴스 검색 도구
         
+        주기적으로 같은 검색어를 확인할 때는 cursor를 사용하세요. 처음에는 빈 문자열을 전달하고,
+        이후에는 이전 응답의 cursor를 전달하면 지난 호출 이후 게시된 기사만 반환합니다.
+        새 기사가 limit보다 많으면 오래된 기사부터 limit개를 반환하고, 나머지는 다음 호출에서 반환합니다.
+        
+        stream이면 소스별 검색 결과 페이지가 도착할 때마다 중간 결과(중복 묶기 전)를 로그 알림
+        (logger "search_news.partial", 메시지는 {"source", "page", "articles"} JSON)과
+        진행 상황 알림으로 보내고, 마지막에 병합된 전체 결과를 반환합니다.
+        
+        budget초 안에 끝나지 않은 소스는 요청을 취소하고 그때까지 받은 페이지의 기사만 사용하며,
+        연속으로 실패해 일시적으로 차단된 소스는 건너뜁니다. 이 경우
+        {"articles", "partial": true, "incomplete": 끝나지 않았거나 건너뛴 소스 목록}을 반환합니다.
+        
         Args:
             query: 검색어
             source: 뉴스 소스 (fox, reuters, all)
             limit: 최대 결과 수
+            cursor: 이전 응답의 커서 (빈 문자열이면 새 커서 시작, 생략하면 일반 검색)
+            stream: 페이지별 중간 결과 전송 여부
+            budget: 제한 시간(초, 0이면 제한 없음)
             
         Returns:
-            검색된 뉴스 기사 목록
+            검색된 뉴스 기사 목록 (거의 같은 기사는 최신 기사의 "duplicates"로 묶음).
+            cursor를 전달하면 {"articles": 새 기사 목록, "cursor": 다음 커서,
+            "skipped": limit을 넘어 다음 호출에서 반환할 새 기사 수}
         """
         if ctx:
             await ctx.info(f"'{query}' 관련 뉴스를 {source} 소스에서 검색합니다.")
         
-        results = []
-        tasks = []
+        # 커서 모드: 캐시를 읽지 않고, 소스별 기준 시각 이후 기사가 끝나는 페이지까지만 요청
+        state = None
+        if cursor is not None:
+            if cursor:
+                state = decode_cursor(cursor)
+                if state is None or state.get("q") != normalize_query(query) or state.get("source") != source:
+                    if ctx:
+                        await ctx.error("이 검색어와 소스에 사용할 수 없는 커서입니다.")
+                    return {"error": "유효하지 않은 커서"}
+            else:
+                state = {"q": normalize_query(query), "source": source, "hw": {}, "seen": {}}
+        
+        # 처리된 페이지의 기사를 소스별로 모아 두고 (제한 시간을 넘긴 소스는 이것만 사용),
+        # 스트리밍이면 그 페이지의 기사를 바로 전송
+        pages = {}
+        pages_done = 0
         
-        # 소스에 따라 적절한 크롤러 사용
+        def page_handler(name):
+            async def on_page(page, articles):
+                nonlocal pages_done
+                pages.setdefault(name, []).extend(articles)
+                pages_done += 1
+                if not (stream and ctx and articles):
+                    return
+                
+                batch = {"source": name, "page": page, "articles": articles}
+                await ctx.info(json.dumps(batch, ensure_ascii=False), logger_name="search_news.partial")
+                await ctx.report_progress(pages_done, message=f"{name} {page + 1}페이지: {len(articles)}개")
+            return on_page
+        
+        def crawl(crawler):
+            on_page = page_handler(crawler.name)
+            if state is None:
+                return crawler.fetch_articles(query, limit, on_page=on_page)
+            since = state["hw"].get(crawler.name)
+            return crawler.fetch_articles(
+                query, limit if since is None else None, refresh=True,
+                since=since, seen=set(state["seen"].get(crawler.name, ())), on_page=on_page
+            )
+        
+        crawlers = []
+        incomplete = []
+        
+        # 소스에 따라 적절한 크롤러 사용 (회로 차단기가 열린 소스는 요청 없이 건너뜀)
         if source in ["fox", "all"]:
             if ctx:
                 await ctx.info("Fox News에서 검색 중...")
-            tasks.append(fox_crawler.fetch_articles(query))
+            crawlers.append(fox_crawler)
             
         if source in ["reuters", "all"]:
             if ctx:
                 await ctx.info("Reuters에서 검색 중...")
-            tasks.append(reuters_crawler.fetch_articles(query))
+            crawlers.append(reuters_crawler)
+        
+        unavailable = [crawler for crawler in crawlers if not crawler.is_available()]
+        if unavailable:
+            incomplete.extend(crawler.name for crawler in unavailable)
+            crawlers = [crawler for crawler in crawlers if crawler not in unavailable]
+            if ctx:
+                await ctx.warning(f"일시적으로 사용할 수 없는 소스: {', '.join(incomplete)}")
         
-        # 병렬로 검색 실행
-        crawl_results = await asyncio.gather(*tasks)
+        # 병렬로 검색 실행 (마감 시각은 모든 업스트림 요청에 적용)
+        with deadline_scope(budget):
+            tasks = [asyncio.create_task(crawl(crawler)) for crawler in crawlers]
+            if tasks:
+                await asyncio.wait(tasks, timeout=time_remaining())
+            await cancel_and_wait(tasks)
         
-        # 결과 합치기
-        for result in crawl_results:
-            results.extend(result)
+        crawl_results = []
+        for crawler, task in zip(crawlers, tasks):
+            if not task.cancelled() and task.exception() is None:
+                crawl_results.append(task.result())
+            else:
+                # 끝나지 않았거나 실패한 소스는 처리된 페이지까지만 사용
+                incomplete.append(crawler.name)
+                crawl_results.append(pages.get(crawler.name, []))
         
-        # 날짜순 정렬 및 개수 제한
-        results = sorted(results, key=lambda x: x.get("date", ""), reverse=True)[:limit]
+        failed = incomplete[len(unavailable):]
+        if failed and ctx:
+            await ctx.warning(f"제한 시간 안에 끝나지 않았거나 실패한 소스: {', '.join(failed)}")
+        
+        # 소스별 최신순 결과를 병합하고 중복 기사를 묶으며 개수 제한
+        with tracer.span("merge_and_dedupe"):
+            merged = merge_newest_first(crawl_results, None)
+            if state is None or not state["hw"]:
+                # 일반 검색이나 새 커서는 최신 기사부터 반환
+                found = results = collapse_duplicates(merged, limit)
+            else:
+                # 기준 시각 이후 기사 중 오래된 것부터 반환 (더 최근 기사는 다음 호출에서 반환)
+                found = collapse_duplicates(merged, len(merged))
+                results = found[max(len(found) - limit, 0):]
         
         if ctx:
             await ctx.info(f"{len(results)}개의 기사를 찾았습니다.")
         
-        return results
\ No newline at end of file
+        if state is None:
+            if not incomplete:
+                return results
+            return {"articles": results, "partial": True, "incomplete": incomplete}
+        
+        # 새 커서는 가져온 기사 전체에서 시작하고, 이후에는 반환한 기사(묶인 중복 기사 포함)까지만 기준 시각을 올림.
+        # 끝나지 않은 소스는 받지 못한 기사가 있을 수 있으므로 기준 시각을 올리지 않음
+        if state["hw"]:
+            returned = [item for article in results for item in (article, *article.get("duplicates", ()))]
+        else:
+            returned = [article for articles in crawl_results for article in articles]
+        advance_cursor(state, [article for article in returned if article.get("source") not in incomplete])
+        result = {"articles": results, "cursor": encode_cursor(state), "skipped": len(found) - len(results)}
+        if incomplete:
+            result.update(partial=True, incomplete=incomplete)
+        return result
+    
+    @mcp.tool()
+    async def search_local_archive(query: str, source: str = "all", since: str = None, until: str = None,
+                                   limit: int = DEFAULT_LIMIT, ctx: Context = None) -> list | dict:
+        """
+        이전에 가져온 기사 보관소에서 전문 검색 (네트워크 요청 없음)
+        
+        Args:
+            query: 검색어 (모든 단어가 포함된 기사 우선, 없으면 일부 단어 일치)
+            source: 뉴스 소스 (fox, reuters, all)
+            since: 이 날짜 이후 게시된 기사만 (YYYY-MM-DD)
+            until: 이 날짜까지 게시된 기사만 (YYYY-MM-DD)
+            limit: 최대 결과 수
+            
+        Returns:
+            관련도순 기사 목록 (제목, URL, 소스, 게시 시간, 일치 부분 발췌, 점수)
+        """
+        if source != "all" and source not in SOURCE_NAMES:
+            if ctx:
+                await ctx.error(f"지원되지 않는 소스입니다: {source}")
+            return {"error": f"지원되지 않는 소스: {source}"}
+        
+        if ctx:
+            await ctx.info(f"보관된 기사에서 '{query}'을(를) 검색합니다.")
+        
+        results = await search_index.search(query, SOURCE_NAMES.get(source), since, until, limit)
+        
+        if ctx:
+            await ctx.info(f"{len(results)}개의 보관된 기사를 찾았습니다.")
+        
+        return results
@@ -0,0 +1,44 @@
+# tools/store.py
+from fastmcp import Context
+from storage.article_store import article_store
+from storage.search_index import search_index
+
+def register_store_tools(mcp):
+    """기사 저장소 관리 도구 등록"""
+    
+    @mcp.tool()
+    async def article_store_info(url: str = None, ctx: Context = None) -> dict:
+        """
+        로컬 기사 저장소의 상태를 확인합니다.
+        
+        Args:
+            url: 지정하면 해당 기사의 저장 정보를 반환
+            
+        Returns:
+            저장소 통계 또는 저장된 기사 정보
+        """
+        if url:
+            stored = await article_store.get(url)
+            if stored is None:
+                return {"error": "저장된 기사가 없습니다."}
+            return stored
+        
+        return await article_store.stats()
+    
+    @mcp.tool()
+    async def purge_article_store(older_than_days: float = None, source: str = None, ctx: Context = None) -> dict:
+        """
+        로컬 기사 저장소에서 기사를 삭제합니다. 삭제한 기사는 보관소 검색(search_local_archive)에서도 제외됩니다.
+        
+        Args:
+            older_than_days: 지정한 일수보다 오래 전에 가져온 기사만 삭제
+            source: 지정한 소스(Fox News, Reuters)의 기사만 삭제
+            
+        Returns:
+            삭제된 기사 수와 전문 색인에서 제거된 기사 수
+        """
+        deleted = await article_store.purge(older_than_days, source)
+        unindexed = await search_index.remove(deleted)
+        if ctx:
+            await ctx.info(f"{len(deleted)}개의 저장된 기사를 삭제했습니다.")
+        return {"deleted": len(deleted), "unindexed": unindexed}
@@ -0,0 +1,72 @@
+# tools/watch.py
+from fastmcp import Context
+from crawlers.watchlist import watchlist, WATCH_SOURCES
+from config import WATCHLIST_DEFAULT_INTERVAL
+from tools.fetch import index_article
+
+def register_watch_tools(mcp):
+    """관심 검색어 관리 도구 등록"""
+    
+    # 미리 가져온 기사도 직접 가져온 기사와 같은 색인에 반영
+    watchlist.on_article = index_article
+    
+    @mcp.tool()
+    async def add_watch(query: str, source: str = "all", interval: int = WATCHLIST_DEFAULT_INTERVAL, prefetch: bool = True, ctx: Context = None) -> dict:
+        """
+        관심 검색어를 등록하여 백그라운드에서 주기적으로 검색합니다.
+        
+        검색 결과 캐시를 미리 갱신하고 새로 나온 기사를 미리 가져오므로, 같은 검색어로
+        search_news나 fetch_article을 호출하면 바로 응답합니다.
+        
+        Args:
+            query: 검색어
+            source: 뉴스 소스 (fox, reuters, all)
+            interval: 확인 주기(초), 새 기사가 없으면 점차 늘어남
+            prefetch: 새 기사 본문을 미리 가져올지 여부
+            
+        Returns:
+            등록된 관심 검색어 정보
+        """
+        if source not in WATCH_SOURCES:
+            return {"error": f"지원되지 않는 소스: {source}"}
+        if not query.strip():
+            return {"error": "검색어가 비어 있습니다."}
+        
+        try:
+            watch = await watchlist.add(query, source, interval, prefetch)
+        except ValueError as e:
+            return {"error": str(e)}
+        
+        if ctx:
+            await ctx.info(f"관심 검색어를 등록했습니다: {watch.id}")
+        
+        return watch.to_dict()
+    
+    @mcp.tool()
+    async def list_watches(ctx: Context = None) -> list:
+        """
+        등록된 관심 검색어 목록을 확인합니다.
+        
+        Returns:
+            관심 검색어별 설정, 다음 확인까지 남은 시간, 확인/새 기사/미리 가져온 기사 수
+        """
+        return watchlist.snapshot()
+    
+    @mcp.tool()
+    async def remove_watch(watch_id: str, ctx: Context = None) -> dict:
+        """
+        관심 검색어를 삭제합니다.
+        
+        Args:
+            watch_id: list_watches의 id (예: all:tesla)
+            
+        Returns:
+            삭제 여부
+        """
+        if not await watchlist.remove(watch_id):
+            return {"error": f"등록되지 않은 관심 검색어: {watch_id}"}
+        
+        if ctx:
+            await ctx.info(f"관심 검색어를 삭제했습니다: {watch_id}")
+        
+        return {"removed": watch_id}
@@ -0,0 +1,343 @@
+# utils/async_helpers.py
+import asyncio
+import contextvars
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# 현재 도구 호출의 마감 시각 (time.monotonic 기준, 없으면 None, 공유 작업이면 SharedDeadline)
+_deadline = contextvars.ContextVar("deadline", default=None)
+
+class SharedDeadline:
+    """여러 호출이 기다리는 공유 작업의 마감 시각 (대기자 중 가장 늦은 마감 시각)"""
+    
+    def __init__(self):
+        self.deadlines = []
+    
+    @property
+    def value(self):
+        """가장 늦은 마감 시각 (마감이 없는 대기자가 있으면 None)"""
+        if not self.deadlines or None in self.deadlines:
+            return None
+        return max(self.deadlines)
+
+def _current_deadline():
+    deadline = _deadline.get()
+    return deadline.value if isinstance(deadline, SharedDeadline) else deadline
+
+@contextmanager
+def deadline_scope(budget):
+    """
+    budget초 뒤를 마감 시각으로 설정 (budget이 없거나 0 이하면 제한 없음)
+    
+    이미 더 이른 마감 시각이 있으면 그대로 유지하며, 안에서 만든 태스크도 같은 마감 시각을 따름
+    """
+    deadline = time.monotonic() + budget if budget and budget > 0 else None
+    current = _current_deadline()
+    if current is not None and (deadline is None or current < deadline):
+        deadline = current
+    
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+# 백그라운드 작업(관심 검색어 확인 등)에서 실행 중인지 (동시 요청 자리를 도구 호출에 양보)
+_background = contextvars.ContextVar("background", default=False)
+
+@contextmanager
+def background_scope():
+    """안에서 보내는 업스트림 요청을 백그라운드 작업으로 표시"""
+    token = _background.set(True)
+    try:
+        yield
+    finally:
+        _background.reset(token)
+
+def time_remaining():
+    """마감 시각까지 남은 시간(초, 마감이 없으면 None)"""
+    deadline = _current_deadline()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+async def cancel_and_wait(tasks):
+    """끝나지 않은 태스크를 취소하고 정리될 때까지 대기"""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+class TokenBucket:
+    """비동기 토큰 버킷 (대기자는 도착 순서대로 처리)"""
+    
+    def __init__(self, rate, burst, jitter=0.0):
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        """경과 시간만큼 토큰 보충"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self):
+        """토큰 하나를 소비 (예산이 남아 있으면 즉시 반환)"""
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                # 토큰이 모자랄 때만 부족분만큼 대기
+                wait = (1 - self.tokens) / self.rate
+                wait *= 1 + self.jitter * random.random()
+                await asyncio.sleep(wait)
+                self._refill()
+            self.tokens -= 1
+    
+    def try_acquire(self):
+        """대기 없이 토큰을 소비할 수 있으면 소비하고 True (대기자가 있으면 양보)"""
+        if self._lock.locked():
+            return False
+        self._refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 모음"""
+    
+    def __init__(self, rate, burst, jitter=0.0, overrides=None):
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self.overrides = overrides or {}
+        self.buckets = {}
+    
+    def bucket(self, host):
+        """호스트의 토큰 버킷 반환 (없으면 생성)"""
+        if host not in self.buckets:
+            rate, burst = self.overrides.get(host, (self.rate, self.burst))
+            self.buckets[host] = TokenBucket(rate, burst, self.jitter)
+        return self.buckets[host]
+    
+    async def acquire(self, url):
+        """URL의 호스트 예산에서 요청 하나를 할당"""
+        await self.bucket(urlsplit(url).netloc).acquire()
+    
+    def try_acquire(self, url):
+        """URL의 호스트 예산이 남아 있을 때만 요청 하나를 할당 (헤지 요청 등 선택적인 요청용)"""
+        return self.bucket(urlsplit(url).netloc).try_acquire()
+
+
+class AdaptiveLimit:
+    """
+    AIMD 방식으로 상한을 조절하는 비동기 동시 실행 제한 (도구 호출 대기자를 백그라운드 대기자보다 먼저 처리)
+    
+    상한을 채워 쓰는 동안 응답 시간이 평소 수준이면 상한만큼 응답을 받을 때마다 1씩 늘리고,
+    과부하 응답(429 등)을 받거나 최근 응답 시간이 평소의 tolerance배를 넘으면 backoff배로 줄임
+    (줄이는 것은 최근 응답 시간에 한 번까지)
+    """
+    
+    def __init__(self, initial, minimum, maximum, backoff=0.5, tolerance=2.0):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.in_flight = 0
+        self.baseline = None   # 평소 응답 시간 (천천히 따라가는 이동 평균)
+        self.recent = None     # 최근 응답 시간 (빠르게 따라가는 이동 평균)
+        self.last_decrease = 0.0
+        self.waiters = {False: deque(), True: deque()}  # 백그라운드 여부 → 대기 중인 future
+        self.counters = {"increases": 0, "decreases": 0, "overloaded": 0, "latency_spikes": 0}
+    
+    def _has_slot(self, background):
+        if self.in_flight >= int(self.limit) or self.waiters[False]:
+            return False
+        return not (background and self.waiters[True])
+    
+    async def acquire(self):
+        """자리 하나를 할당 (상한에 도달했으면 대기)"""
+        background = _background.get()
+        if self._has_slot(background):
+            self.in_flight += 1
+            return
+        
+        future = asyncio.get_running_loop().create_future()
+        self.waiters[background].append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 자리를 받은 직후 취소되면 다음 대기자에게 넘김
+                self.in_flight -= 1
+                self._wake()
+            elif future in self.waiters[background]:
+                self.waiters[background].remove(future)
+            raise
+    
+    def has_capacity(self):
+        """대기 없이 자리를 받을 수 있는지 (헤지 요청 등 선택적인 요청용)"""
+        return self._has_slot(True)
+    
+    def release(self, latency=None, overloaded=False):
+        """
+        자리 반환
+        
+        Args:
+            latency: 응답 시간(초, 응답을 받지 못했으면 None)
+            overloaded: 상대 서버가 과부하 신호(429, 503, 연결 실패)를 보냈는지
+        """
+        self.in_flight -= 1
+        if overloaded:
+            self.counters["overloaded"] += 1
+            self._decrease()
+        elif latency is not None:
+            self._observe(latency)
+        self._wake()
+    
+    def _observe(self, latency):
+        if self.baseline is None:
+            self.baseline = self.recent = latency
+            return
+        
+        self.recent = 0.7 * self.recent + 0.3 * latency
+        spike = self.recent > self.baseline * self.tolerance
+        # 평소 응답 시간도 천천히 따라가므로 지속되는 변화는 수십 번의 응답 뒤 새 평소 수준이 됨
+        self.baseline = 0.95 * self.baseline + 0.05 * latency
+        if spike:
+            self.counters["latency_spikes"] += 1
+            self._decrease()
+            return
+        
+        # 상한을 채워 쓰고 있을 때만 늘림 (요청이 적을 때 상한이 의미 없이 커지지 않도록)
+        if self.in_flight + 1 >= int(self.limit) and self.limit < self.maximum:
+            before = int(self.limit)
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            if int(self.limit) > before:
+                self.counters["increases"] += 1
+    
+    def _decrease(self):
+        now = time.monotonic()
+        if now - self.last_decrease < (self.recent or 0):
+            return
+        self.last_decrease = now
+        if self.limit > self.minimum:
+            self.limit = max(self.minimum, self.limit * self.backoff)
+            self.counters["decreases"] += 1
+    
+    def _wake(self):
+        """상한 안에서 도구 호출 대기자부터 자리 할당"""
+        for background in (False, True):
+            queue = self.waiters[background]
+            while queue and self.in_flight < int(self.limit):
+                future = queue.popleft()
+                if not future.done():
+                    self.in_flight += 1
+                    future.set_result(None)
+    
+    def stats(self):
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": len(self.waiters[False]) + len(self.waiters[True]),
+            "baseline_ms": round(self.baseline * 1000, 1) if self.baseline is not None else None,
+            "recent_ms": round(self.recent * 1000, 1) if self.recent is not None else None,
+            **self.counters
+        }
+
+
+class HostConcurrencyLimiter:
+    """호스트별 적응형 동시 요청 제한 모음"""
+    
+    def __init__(self, initial, minimum, maximum, backoff=0.5, tolerance=2.0):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.limits = {}
+    
+    def limit(self, host):
+        """호스트의 동시 요청 제한 반환 (없으면 생성)"""
+        if host not in self.limits:
+            self.limits[host] = AdaptiveLimit(self.initial, self.minimum, self.maximum, self.backoff, self.tolerance)
+        return self.limits[host]
+    
+    def stats(self):
+        return {host: limit.stats() for host, limit in sorted(self.limits.items())}
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 작업을 한 번만 실행하고 결과를 공유
+    
+    공유 작업은 대기자 중 가장 늦은 마감 시각까지 실행하고, 대기자가 모두 취소되거나
+    마감 시각을 넘기면 공유 작업도 취소
+    """
+    
+    def __init__(self):
+        self.tasks = {}
+        self.waiters = {}  # key -> 결과를 기다리는 호출들의 마감 시각 (SharedDeadline)
+        self.counters = {"executed": 0, "shared": 0, "cancelled": 0}
+    
+    async def do(self, key, func):
+        """
+        key의 작업이 진행 중이면 그 결과를 기다리고, 없으면 func()를 실행
+        
+        대기자마다 자신의 마감 시각까지만 기다림 (마감 시각을 넘기면 TimeoutError)
+        """
+        deadline = _current_deadline()
+        task = self.tasks.get(key)
+        if task is None:
+            self.counters["executed"] += 1
+            shared = self.waiters[key] = SharedDeadline()
+            shared.deadlines.append(deadline)
+            context = contextvars.copy_context()
+            context.run(_deadline.set, shared)
+            task = context.run(asyncio.create_task, func())
+            self.tasks[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.counters["shared"] += 1
+            self.waiters[key].deadlines.append(deadline)
+        
+        # 한 대기자가 취소되거나 마감 시각을 넘겨도 다른 대기자가 있으면 공유 작업은 계속 진행
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), time_remaining())
+        finally:
+            self._leave(key, task, deadline)
+    
+    def _leave(self, key, task, deadline):
+        """대기자 하나가 빠짐 (마지막 대기자였고 작업이 끝나지 않았으면 취소)"""
+        if self.tasks.get(key) is not task:
+            return
+        self.waiters[key].deadlines.remove(deadline)
+        if self.waiters[key].deadlines or task.done():
+            return
+        
+        # 취소 중인 작업에 새 대기자가 붙지 않도록 바로 제거
+        self.counters["cancelled"] += 1
+        del self.tasks[key]
+        del self.waiters[key]
+        task.cancel()
+    
+    def _finish(self, key, task):
+        if self.tasks.get(key) is task:
+            del self.tasks[key]
+            del self.waiters[key]
+        # 모든 대기자가 취소된 경우에도 예외가 회수되도록 처리
+        if not task.cancelled():
+            task.exception()
+    
+    def stats(self):
+        """실행/공유/취소 횟수와 진행 중인 작업 수"""
+        return {**self.counters, "in_flight": len(self.tasks)}
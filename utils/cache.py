@@ -0,0 +1,131 @@
+# utils/cache.py
+import asyncio
+import contextvars
+import json
+import logging
+import time
+from collections import OrderedDict
+from config import (
+    SEARCH_CACHE_TTL, SEARCH_CACHE_GRACE,
+    SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_MAX_BYTES
+)
+
+logger = logging.getLogger(__name__)
+
+def normalize_query(query):
+    """캐시 키용 검색어 정규화 (대소문자, 공백 통일)"""
+    return " ".join(query.lower().split())
+
+class TTLCache:
+    """TTL + LRU 캐시 (만료 후 유예 기간 동안은 이전 값을 반환하고 백그라운드에서 갱신)"""
+    
+    def __init__(self, ttl, grace, max_entries, max_bytes):
+        self.ttl = ttl
+        self.grace = grace
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (value, stored_at, size)
+        self.total_bytes = 0
+        self.refreshing = {}          # key -> 갱신 태스크
+        self.counters = {"hits": 0, "stale_hits": 0, "misses": 0, "reloads": 0, "evictions": 0}
+    
+    async def get_or_load(self, key, loader):
+        """캐시된 값을 반환하고, 없거나 너무 오래됐으면 loader로 가져오기"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            value, stored_at, _ = entry
+            age = time.monotonic() - stored_at
+            
+            if age < self.ttl:
+                self.counters["hits"] += 1
+                self.entries.move_to_end(key)
+                return value
+            
+            if age < self.ttl + self.grace:
+                # 유예 기간: 이전 값을 바로 반환하고 갱신은 백그라운드로
+                self.counters["stale_hits"] += 1
+                self.entries.move_to_end(key)
+                self._refresh(key, loader)
+                return value
+        
+        self.counters["misses"] += 1
+        value = await loader()
+        self.set(key, value)
+        return value
+    
+    async def reload(self, key, loader):
+        """캐시 상태와 관계없이 loader로 가져와 저장 (관심 검색어 미리 갱신용)"""
+        self.counters["reloads"] += 1
+        value = await loader()
+        self.set(key, value)
+        return value
+    
+    def set(self, key, value):
+        """값 저장 (실패 결과인 None은 저장하지 않음)"""
+        if value is None:
+            return
+        
+        self._remove(key)
+        size = len(json.dumps(value, ensure_ascii=False, default=str))
+        if size > self.max_bytes:
+            return
+        
+        self.entries[key] = (value, time.monotonic(), size)
+        self.total_bytes += size
+        
+        # 가장 오래 사용되지 않은 항목부터 제거
+        while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.counters["evictions"] += 1
+    
+    def _remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+    
+    def _refresh(self, key, loader):
+        """같은 키의 갱신은 한 번만 실행"""
+        if key in self.refreshing:
+            return
+        
+        async def refresh():
+            try:
+                self.set(key, await loader())
+            except Exception as e:
+                logger.exception("캐시 갱신 중 오류: %s", e)
+            finally:
+                self.refreshing.pop(key, None)
+        
+        # 요청한 도구 호출의 마감 시각과 트레이스를 물려받지 않도록 빈 컨텍스트에서 실행
+        self.refreshing[key] = contextvars.Context().run(asyncio.create_task, refresh())
+    
+    def clear(self):
+        """모든 항목 제거"""
+        self.entries.clear()
+        self.total_bytes = 0
+    
+    async def close(self):
+        """진행 중인 백그라운드 갱신 취소"""
+        tasks = list(self.refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.refreshing.clear()
+    
+    def stats(self):
+        """캐시 통계"""
+        lookups = self.counters["hits"] + self.counters["stale_hits"] + self.counters["misses"]
+        hit_count = self.counters["hits"] + self.counters["stale_hits"]
+        return {
+            **self.counters,
+            "hit_rate": round(hit_count / lookups, 3) if lookups else 0.0,
+            "entries": len(self.entries),
+            "bytes": self.total_bytes
+        }
+
+# 검색 결과 페이지 캐시 (키: 소스, 정규화된 검색어, 페이지 번호)
+search_cache = TTLCache(
+    SEARCH_CACHE_TTL, SEARCH_CACHE_GRACE,
+    SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_MAX_BYTES
+)
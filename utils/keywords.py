@@ -0,0 +1,120 @@
+# utils/keywords.py
+import heapq
+import math
+import re
+from collections import Counter
+from config import ENGLISH_STOPWORDS, KEYWORD_BM25_K1, KEYWORD_BM25_B
+
+# 토큰화용 정규식 (모듈 로드 시 한 번만 컴파일)
+TAG_PATTERN = re.compile(r"<.*?>")
+NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+STOPWORDS = frozenset(ENGLISH_STOPWORDS)
+
+def tokenize(text):
+    """소문자화, 태그/특수 문자 제거 후 단어 목록 반환 (불용어 포함)"""
+    text = TAG_PATTERN.sub("", text.lower())
+    return NON_WORD_PATTERN.sub("", text).split()
+
+def extract_terms(text, bigrams=True):
+    """불용어와 짧은 단어를 제외한 단어, 그리고 원문에서 인접한 단어 쌍(바이그램) 목록"""
+    terms = []
+    previous = None
+    for word in tokenize(text):
+        if word in STOPWORDS or len(word) <= 2:
+            previous = None
+            continue
+        
+        terms.append(word)
+        if bigrams and previous is not None:
+            terms.append(f"{previous} {word}")
+        previous = word
+    return terms
+
+def article_text(article):
+    """기사 데이터에서 분석할 전체 텍스트 추출"""
+    parts = [article.get("metadata", {}).get("headline", ""), article.get("metadata", {}).get("subheadline", "")]
+    for item in article.get("content", []):
+        if item.get("type") in ("text", "quote", "subheading"):
+            parts.append(item.get("content", ""))
+    return " ".join(parts)
+
+class KeywordIndex:
+    """가져온 기사 전체에 대한 문서 빈도(DF) 색인과 TF-IDF/BM25 키워드 점수 계산"""
+    
+    def __init__(self):
+        self.doc_freq = Counter()
+        self.doc_ids = set()
+        self.doc_count = 0
+        self.total_length = 0
+    
+    def add_document(self, text, doc_id=None):
+        """문서를 색인에 추가 (같은 doc_id는 한 번만 반영)"""
+        if doc_id is not None:
+            if doc_id in self.doc_ids:
+                return False
+            self.doc_ids.add(doc_id)
+        
+        terms = extract_terms(text)
+        self.doc_freq.update(set(terms))
+        self.doc_count += 1
+        self.total_length += len(terms)
+        return True
+    
+    def add_article(self, article):
+        """기사 데이터를 URL 기준으로 색인에 추가"""
+        url = article.get("metadata", {}).get("url")
+        return self.add_document(article_text(article), url)
+    
+    def add_articles(self, articles):
+        """여러 기사를 색인에 추가 (저장소에서 초기 색인 구성 시 사용)"""
+        added = 0
+        for article in articles:
+            if self.add_article(article):
+                added += 1
+        return added
+    
+    def idf(self, term):
+        """역문서 빈도 (색인이 비어 있으면 모든 단어가 같은 가중치)"""
+        df = self.doc_freq.get(term, 0)
+        return math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+    
+    def score(self, text, count, method="tfidf", bigrams=True):
+        """한 문서의 상위 키워드"""
+        return self.score_many([text], count, method, bigrams)[0]
+    
+    def score_many(self, texts, count, method="tfidf", bigrams=True):
+        """여러 문서의 상위 키워드를 한 번에 계산 (IDF는 배치 전체에서 단어별로 한 번만 계산)"""
+        term_counts = [Counter(extract_terms(text, bigrams)) for text in texts]
+        
+        vocabulary = set()
+        for counts in term_counts:
+            vocabulary.update(counts)
+        idf = {term: self.idf(term) for term in vocabulary}
+        
+        avg_length = self.total_length / self.doc_count if self.doc_count else 0
+        results = []
+        for counts in term_counts:
+            length = sum(counts.values())
+            if method == "bm25":
+                # 문서 길이를 정규화한 BM25 단어 가중치
+                norm = KEYWORD_BM25_K1 * (1 - KEYWORD_BM25_B + KEYWORD_BM25_B * length / (avg_length or length or 1))
+                scores = {
+                    term: idf[term] * tf * (KEYWORD_BM25_K1 + 1) / (tf + norm)
+                    for term, tf in counts.items()
+                }
+            else:
+                scores = {term: idf[term] * tf / length for term, tf in counts.items()}
+            
+            top = heapq.nlargest(count, scores.items(), key=lambda item: (item[1], counts[item[0]]))
+            results.append([
+                {"word": term, "count": counts[term], "score": round(score, 4)}
+                for term, score in top
+            ])
+        return results
+    
+    def stats(self):
+        """색인 통계"""
+        return {"documents": self.doc_count, "terms": len(self.doc_freq)}
+
+# 서버가 가져온 모든 기사에 대한 공유 색인
+keyword_index = KeywordIndex()
@@ -0,0 +1,239 @@
+# utils/metrics.py
+import functools
+import inspect
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from urllib.parse import urlsplit
+from utils.tracing import tracer
+
+# 지연 시간 히스토그램 구간 상한(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Histogram:
+    """고정 구간 히스토그램 (기록은 O(log 구간 수), 백분위수는 구간 상한으로 근사)"""
+    
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 최대 구간 초과
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    def quantile(self, q):
+        """q 백분위수가 속한 구간의 상한 (최대 구간을 넘으면 inf)"""
+        if not self.count:
+            return 0.0
+        
+        target = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.buckets[index] if index < len(self.buckets) else float("inf")
+        return float("inf")
+    
+    def cumulative(self):
+        """(구간 상한, 누적 개수) 목록 (Prometheus le 형식)"""
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+    
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "avg_ms": round(self.sum / self.count * 1000, 2) if self.count else 0.0,
+            "p50_ms": self.quantile(0.5) * 1000,
+            "p90_ms": self.quantile(0.9) * 1000,
+            "p99_ms": self.quantile(0.99) * 1000
+        }
+
+class ToolMetrics:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram()
+
+class HostMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0  # 연결 실패 등 응답을 받지 못한 요청
+        self.bytes = 0
+        self.statuses = Counter()
+        self.latency = Histogram()
+
+class Metrics:
+    """도구 호출과 업스트림 요청 지표 (이벤트 루프 안에서만 기록하므로 잠금 없음)"""
+    
+    def __init__(self):
+        self.tools = defaultdict(ToolMetrics)
+        self.hosts = defaultdict(HostMetrics)
+        self.active = 0                        # 실행 중인 도구 호출 수
+        self.last_active = time.monotonic()    # 마지막 도구 호출이 끝난 시각
+    
+    def start_tool(self):
+        self.active += 1
+    
+    def record_tool(self, name, duration, error=False):
+        self.active -= 1
+        self.last_active = time.monotonic()
+        tool = self.tools[name]
+        tool.calls += 1
+        if error:
+            tool.errors += 1
+        tool.latency.observe(duration)
+    
+    def record_request(self, url, status, size, duration):
+        """업스트림 요청 기록 (status가 None이면 응답을 받지 못한 요청, "cancelled"면 취소된 요청)"""
+        host = self.hosts[urlsplit(url).netloc]
+        host.requests += 1
+        if status is None:
+            host.errors += 1
+        else:
+            host.statuses[status] += 1
+        host.bytes += size
+        host.latency.observe(duration)
+    
+    def idle(self, quiet):
+        """실행 중인 도구 호출이 없고 마지막 호출이 끝난 지 quiet초가 지났는지"""
+        return self.active == 0 and time.monotonic() - self.last_active >= quiet
+    
+    def calls(self, name):
+        tool = self.tools.get(name)
+        return tool.calls if tool else 0
+    
+    def snapshot(self):
+        return {
+            "active_tools": self.active,
+            "tools": {
+                name: {"calls": tool.calls, "errors": tool.errors, "latency": tool.latency.snapshot()}
+                for name, tool in sorted(self.tools.items())
+            },
+            "upstream": {
+                host: {
+                    "requests": metrics.requests,
+                    "errors": metrics.errors,
+                    "bytes": metrics.bytes,
+                    "statuses": {str(status): count for status, count in metrics.statuses.items()},
+                    "latency": metrics.latency.snapshot()
+                }
+                for host, metrics in sorted(self.hosts.items())
+            }
+        }
+    
+    def prometheus(self, gauges=None):
+        """
+        Prometheus 텍스트 형식으로 변환
+        
+        Args:
+            gauges: 추가로 내보낼 {지표 이름: (설명, 값)} (캐시 적중률 등)
+        """
+        lines = []
+        
+        def header(name, kind, description):
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+        
+        def histogram(name, labels, data):
+            for bound, count in data.cumulative():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {data.sum:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {data.count}")
+        
+        header("news_tool_calls_total", "counter", "도구 호출 수")
+        for name, tool in sorted(self.tools.items()):
+            lines.append(f'news_tool_calls_total{{tool="{name}"}} {tool.calls}')
+        header("news_tool_errors_total", "counter", "오류로 끝난 도구 호출 수")
+        for name, tool in sorted(self.tools.items()):
+            lines.append(f'news_tool_errors_total{{tool="{name}"}} {tool.errors}')
+        header("news_tool_duration_seconds", "histogram", "도구 실행 시간")
+        for name, tool in sorted(self.tools.items()):
+            histogram("news_tool_duration_seconds", f'tool="{name}"', tool.latency)
+        
+        header("news_upstream_responses_total", "counter", "업스트림 응답 수 (상태 코드별)")
+        for host, metrics in sorted(self.hosts.items()):
+            for status, count in sorted(metrics.statuses.items(), key=lambda item: str(item[0])):
+                lines.append(f'news_upstream_responses_total{{host="{host}",status="{status}"}} {count}')
+        header("news_upstream_errors_total", "counter", "응답을 받지 못한 업스트림 요청 수")
+        for host, metrics in sorted(self.hosts.items()):
+            lines.append(f'news_upstream_errors_total{{host="{host}"}} {metrics.errors}')
+        header("news_upstream_bytes_total", "counter", "업스트림에서 받은 본문 바이트 수")
+        for host, metrics in sorted(self.hosts.items()):
+            lines.append(f'news_upstream_bytes_total{{host="{host}"}} {metrics.bytes}')
+        header("news_upstream_duration_seconds", "histogram", "업스트림 요청 시간 (속도 제한 대기 제외)")
+        for host, metrics in sorted(self.hosts.items()):
+            histogram("news_upstream_duration_seconds", f'host="{host}"', metrics.latency)
+        
+        for name, (description, value) in (gauges or {}).items():
+            header(name, "gauge", description)
+            lines.append(f"{name} {value}")
+        
+        return "\n".join(lines) + "\n"
+
+# 서버 전체가 공유하는 지표
+metrics = Metrics()
+
+def is_error_result(result):
+    """도구가 {"error": ...} 형태로 실패를 반환했는지 확인"""
+    return isinstance(result, dict) and "error" in result
+
+def timed_tool(func, name):
+    """도구 함수 실행 시간, 호출/오류 수를 기록하고 샘플링된 호출은 트레이싱하는 래퍼 (시그니처는 그대로 유지)"""
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            metrics.start_tool()
+            start = time.perf_counter()
+            error = True
+            try:
+                with tracer.trace(name):
+                    result = await func(*args, **kwargs)
+                error = is_error_result(result)
+                return result
+            finally:
+                metrics.record_tool(name, time.perf_counter() - start, error)
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics.start_tool()
+            start = time.perf_counter()
+            error = True
+            try:
+                with tracer.trace(name):
+                    result = func(*args, **kwargs)
+                error = is_error_result(result)
+                return result
+            finally:
+                metrics.record_tool(name, time.perf_counter() - start, error)
+    return wrapper
+
+def instrument_tools(mcp):
+    """
+    이후 등록되는 모든 도구를 계측하도록 mcp.tool 데코레이터를 교체
+    
+    MCP로 들어온 호출만 기록하도록 등록에는 계측 래퍼를, 데코레이터 반환값으로는 원래 함수를
+    사용 (도구 안에서 다른 도구 함수를 직접 호출해도 중복 집계되지 않음)
+    """
+    register = mcp.tool
+    
+    def tool(name_or_fn=None, **kwargs):
+        if callable(name_or_fn):
+            register(timed_tool(name_or_fn, kwargs.get("name") or name_or_fn.__name__), **kwargs)
+            return name_or_fn
+        
+        def decorator(func):
+            name = name_or_fn or kwargs.get("name") or func.__name__
+            register(name_or_fn, **kwargs)(timed_tool(func, name))
+            return func
+        return decorator
+    
+    mcp.tool = tool
+    return mcp
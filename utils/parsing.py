@@ -0,0 +1,240 @@
+# utils/parsing.py
+import codecs
+import json
+import re
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from bs4 import BeautifulSoup, SoupStrainer
+from config import HTML_PARSER
+
+def _select_parser():
+    """설정에 따라 HTML 파서 선택 ("auto"면 lxml이 설치된 경우 lxml 사용)"""
+    if HTML_PARSER != "auto":
+        return HTML_PARSER
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+PARSER = _select_parser()
+
+class RegionStrainer(SoupStrainer):
+    """predicate(태그 이름, 속성)에 맞는 태그와 그 하위 트리만 파싱하는 SoupStrainer"""
+    
+    def __init__(self, predicate):
+        # bs4 4.12 이하는 이름 규칙 함수를 (이름, 속성)으로 호출
+        super().__init__(lambda name, attrs=None: predicate(name, attrs or {}))
+        self.predicate = predicate
+    
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        # bs4 4.13 이상은 이 메서드로 최상위 태그 생성 여부를 결정
+        return self.predicate(name, attrs or {})
+    
+    def allow_string_creation(self, string):
+        return False
+
+def get_classes(attrs):
+    """파싱 중 속성 사전에서 class 목록 추출 (문자열/목록 모두 처리)"""
+    classes = attrs.get("class") or []
+    if isinstance(classes, str):
+        return classes.split()
+    return classes
+
+def make_soup(html, parse_only=None):
+    """선택된 파서로 BeautifulSoup 트리 생성 (parse_only로 필요한 영역만 파싱)"""
+    return BeautifulSoup(html, PARSER, parse_only=parse_only)
+
+# 기사 식별에 영향을 주지 않는 추적용 쿼리 파라미터
+TRACKING_PARAMS = frozenset(["fbclid", "gclid", "cmpid", "taid", "intcmp", "ocid", "dicbo"])
+
+def canonicalize_url(url):
+    """같은 기사를 가리키는 URL을 하나의 형태로 정규화"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    netloc = parts.netloc.lower()
+    
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    
+    # 추적용 파라미터 제거 후 정렬
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+# 소스별 게시 시간 표기 형식 (Fox News: "May 1, 2024 10:00am EDT")
+DATE_FORMATS = ["%Y-%m-%d %H:%M:%S", "%B %d, %Y %I:%M%p", "%b %d, %Y %I:%M%p", "%B %d, %Y"]
+
+def normalize_date(value):
+    """게시 시간을 정렬/비교 가능한 "%Y-%m-%d %H:%M:%S" 형식으로 변환 (알 수 없으면 빈 문자열)"""
+    value = (value or "").strip()
+    if not value:
+        return ""
+    
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        pass
+    
+    # 끝에 붙은 시간대 약어(EDT 등) 제거
+    parts = value.split()
+    if parts and parts[-1].isalpha() and parts[-1].isupper():
+        value = " ".join(parts[:-1])
+    
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            continue
+    return ""
+
+def date_timestamp(value):
+    """게시 시간을 UTC 기준 epoch 초로 변환 (시간대가 없으면 UTC로 간주, 알 수 없으면 None)"""
+    value = (value or "").strip()
+    if not value:
+        return None
+    
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        normalized = normalize_date(value)
+        if not normalized:
+            return None
+        parsed = datetime.strptime(normalized, "%Y-%m-%d %H:%M:%S")
+    
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def get_charset(headers, default="utf-8"):
+    """Content-Type 헤더에서 문자 인코딩 추출"""
+    match = re.search(r"charset=\"?([\w.:-]+)", headers.get("Content-Type", ""), re.IGNORECASE)
+    return match.group(1) if match else default
+
+JSON_LD_PATTERN = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL
+)
+
+def find_json_after(text, name):
+    """원문에서 "name = " 바로 뒤에 오는 JSON 값을 디코딩 (없거나 잘못되면 None)"""
+    match = re.search(re.escape(name) + r"\s*=\s*", text)
+    if match is None:
+        return None
+    
+    try:
+        value, _ = json.JSONDecoder().raw_decode(text, match.end())
+    except ValueError:
+        return None
+    return value
+
+def find_json_ld(text):
+    """원문에 포함된 JSON-LD 객체 목록 (@graph와 배열은 펼침)"""
+    objects = []
+    for match in JSON_LD_PATTERN.finditer(text):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            continue
+        
+        items = data if isinstance(data, list) else data.get("@graph", [data]) if isinstance(data, dict) else []
+        objects.extend(item for item in items if isinstance(item, dict))
+    return objects
+
+class _StreamEndParser(HTMLParser):
+    """lxml이 없을 때 사용하는 표준 라이브러리 기반 증분 파서"""
+    
+    def __init__(self, end_region, end_script):
+        super().__init__(convert_charrefs=False)
+        self.end_region = end_region
+        self.end_script = end_script
+        self.target = None
+        self.depth = 0
+        self.in_script = False
+        self.script_tail = ""
+        self.script_has_marker = False
+        self.done = False
+    
+    def handle_starttag(self, tag, attrs):
+        if self.target is None:
+            if self.end_region(tag, dict(attrs)):
+                self.target, self.depth = tag, 1
+        elif tag == self.target:
+            self.depth += 1
+        
+        if tag == "script":
+            self.in_script, self.script_tail, self.script_has_marker = True, "", False
+    
+    def handle_endtag(self, tag):
+        if self.target is not None and tag == self.target:
+            self.depth -= 1
+            if self.depth == 0:
+                self.done = True
+        
+        if tag == "script":
+            if self.script_has_marker:
+                self.done = True
+            self.in_script = False
+    
+    def handle_data(self, data):
+        if self.in_script and self.end_script and not self.script_has_marker:
+            # 청크 경계에 걸친 표식도 찾도록 이전 조각의 끝부분과 이어서 검사
+            text = self.script_tail + data
+            self.script_has_marker = self.end_script in text
+            self.script_tail = text[-len(self.end_script):]
+
+class StreamEndDetector:
+    """
+    청크 단위로 받은 HTML을 증분 파싱하며 필요한 부분을 다 읽었는지 판단
+    
+    end_region(태그 이름, 속성)에 맞는 첫 태그가 닫히거나, end_script 문자열을 포함한
+    스크립트가 닫히면 완료로 판단
+    """
+    
+    def __init__(self, end_region, end_script=None, encoding="utf-8"):
+        self.end_region = end_region
+        self.end_script = end_script
+        self.target = None
+        self.done = False
+        
+        if PARSER == "lxml":
+            from lxml import etree
+            self._pull = etree.HTMLPullParser(events=("start", "end"))
+            self._fallback = None
+        else:
+            self._pull = None
+            self._fallback = _StreamEndParser(end_region, end_script)
+            try:
+                self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            except LookupError:
+                self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    
+    def feed(self, chunk):
+        """바이트 청크를 입력하고 완료 여부 반환"""
+        if self.done:
+            return True
+        
+        if self._fallback is not None:
+            self._fallback.feed(self._decoder.decode(chunk))
+            self.done = self._fallback.done
+            return self.done
+        
+        self._pull.feed(chunk)
+        for event, element in self._pull.read_events():
+            if not isinstance(element.tag, str):
+                continue
+            
+            if event == "start":
+                if self.target is None and self.end_region(element.tag, dict(element.attrib)):
+                    self.target = element
+            elif element is self.target:
+                self.done = True
+            elif element.tag == "script" and self.end_script and self.end_script in (element.text or ""):
+                self.done = True
+        
+        return self.done
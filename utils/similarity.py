@@ -0,0 +1,180 @@
+# utils/similarity.py
+import hashlib
+import random
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from config import (
+    DUPLICATE_TITLE_THRESHOLD, DUPLICATE_BODY_DISTANCE,
+    DUPLICATE_MINHASH_PERMUTATIONS, DUPLICATE_MINHASH_BANDS, DUPLICATE_INDEX_MAX_ENTRIES
+)
+from utils.keywords import STOPWORDS, article_text, extract_terms, tokenize
+from utils.parsing import canonicalize_url
+
+# MinHash 순열용 (a * x + b) mod p 계수 (실행마다 같은 서명이 나오도록 고정 시드)
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+_random = random.Random(1)
+PERMUTATIONS = [
+    (_random.randrange(1, MERSENNE_PRIME), _random.randrange(0, MERSENNE_PRIME))
+    for _ in range(DUPLICATE_MINHASH_PERMUTATIONS)
+]
+
+def hash64(feature):
+    """문자열의 안정적인 64비트 해시 (프로세스마다 바뀌는 hash() 대신 사용)"""
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+def minhash(text, min_words=3):
+    """짧은 텍스트(제목+요약)의 MinHash 서명 (불용어를 뺀 단어 집합 기준, 단어가 너무 적으면 None)"""
+    words = {word for word in tokenize(text) if word not in STOPWORDS and len(word) > 1}
+    if len(words) < min_words:
+        return None
+    
+    hashes = [hash64(word) for word in words]
+    return tuple(
+        min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+        for a, b in PERMUTATIONS
+    )
+
+def simhash(text):
+    """긴 텍스트(본문)의 64비트 SimHash 서명 (단어와 바이그램 빈도 가중, 단어가 없으면 None)"""
+    features = Counter(extract_terms(text))
+    if not features:
+        return None
+    
+    weights = [0] * 64
+    for feature, count in features.items():
+        h = hash64(feature)
+        for bit in range(64):
+            weights[bit] += count if h >> bit & 1 else -count
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+def headline_signature(article):
+    """검색 결과의 제목과 요약으로 만든 서명"""
+    return minhash(f"{article.get('title', '')} {article.get('description', '')}")
+
+def body_signature(article):
+    """가져온 기사 본문으로 만든 서명"""
+    return simhash(article_text(article))
+
+class BandIndex:
+    """서명을 여러 구간(band)으로 나눠 같은 구간 값을 공유하는 후보만 비교하는 LSH 색인"""
+    
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries
+        self.signatures = OrderedDict()  # 키 → 서명 (오래된 것부터)
+        self.buckets = defaultdict(set)  # (구간 번호, 구간 값) → 키 집합
+        # 시작 시 저장소로 색인을 구성하는 스레드와 함께 쓰이므로 잠금
+        self._lock = threading.Lock()
+    
+    def bands(self, signature):
+        raise NotImplementedError("서브클래스에서 구현해야 함")
+    
+    def similarity(self, a, b):
+        """두 서명이 중복 기준을 넘으면 유사도, 아니면 None"""
+        raise NotImplementedError("서브클래스에서 구현해야 함")
+    
+    def add(self, key, signature):
+        """서명 추가 (같은 키는 교체, 최대 개수를 넘으면 가장 오래된 것 제거)"""
+        if signature is None:
+            return
+        
+        with self._lock:
+            self._remove(key)
+            self.signatures[key] = signature
+            for band in self.bands(signature):
+                self.buckets[band].add(key)
+            
+            if self.max_entries and len(self.signatures) > self.max_entries:
+                self._remove(next(iter(self.signatures)))
+    
+    def remove(self, key):
+        with self._lock:
+            self._remove(key)
+    
+    def _remove(self, key):
+        signature = self.signatures.pop(key, None)
+        if signature is None:
+            return
+        for band in self.bands(signature):
+            bucket = self.buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band]
+    
+    def get(self, key):
+        return self.signatures.get(key)
+    
+    def find(self, signature, exclude=None):
+        """중복 기준을 넘는 (키, 유사도) 목록을 유사도 높은 순으로 반환"""
+        if signature is None:
+            return []
+        
+        with self._lock:
+            candidates = set()
+            for band in self.bands(signature):
+                candidates.update(self.buckets.get(band, ()))
+            candidates.discard(exclude)
+            candidates = [(key, self.signatures[key]) for key in candidates]
+        
+        matches = []
+        for key, candidate in candidates:
+            score = self.similarity(signature, candidate)
+            if score is not None:
+                matches.append((key, score))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+    
+    def stats(self):
+        return {"signatures": len(self.signatures), "buckets": len(self.buckets)}
+
+class MinHashIndex(BandIndex):
+    """MinHash 서명 색인 (추정 Jaccard 유사도가 threshold 이상이면 중복)"""
+    
+    def __init__(self, threshold=DUPLICATE_TITLE_THRESHOLD, bands=DUPLICATE_MINHASH_BANDS, max_entries=None):
+        super().__init__(max_entries)
+        self.threshold = threshold
+        self.band_count = bands
+        self.rows = DUPLICATE_MINHASH_PERMUTATIONS // bands
+    
+    def bands(self, signature):
+        rows = self.rows
+        return [(i, signature[i * rows:(i + 1) * rows]) for i in range(self.band_count)]
+    
+    def similarity(self, a, b):
+        score = sum(1 for x, y in zip(a, b) if x == y) / len(a)
+        return score if score >= self.threshold else None
+
+class SimHashIndex(BandIndex):
+    """SimHash 서명 색인 (해밍 거리가 max_distance 이하이면 중복)"""
+    
+    def __init__(self, max_distance=DUPLICATE_BODY_DISTANCE, max_entries=None):
+        super().__init__(max_entries)
+        self.max_distance = max_distance
+        # 구간을 max_distance + 1개로 나누면 기준 이내의 서명은 적어도 한 구간이 일치
+        count = max_distance + 1
+        self.band_bits = [(i * 64 // count, (i + 1) * 64 // count) for i in range(count)]
+    
+    def bands(self, signature):
+        return [
+            (start, (signature >> start) & ((1 << (end - start)) - 1))
+            for start, end in self.band_bits
+        ]
+    
+    def similarity(self, a, b):
+        distance = bin(a ^ b).count("1")
+        return 1 - distance / 64 if distance <= self.max_distance else None
+
+# 검색 결과(제목+요약) 서명: 일괄 가져오기 전에 중복 URL을 거르는 데 사용
+headline_index = MinHashIndex(max_entries=DUPLICATE_INDEX_MAX_ENTRIES)
+
+# 가져온 기사 본문 서명
+body_index = SimHashIndex(max_entries=DUPLICATE_INDEX_MAX_ENTRIES)
+
+def add_article_body(article):
+    """가져온 기사 본문 서명을 색인에 추가하고 서명 반환"""
+    signature = body_signature(article)
+    url = article.get("metadata", {}).get("url")
+    if url:
+        body_index.add(canonicalize_url(url), signature)
+    return signature
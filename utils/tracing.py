@@ -0,0 +1,173 @@
+# utils/tracing.py
+import contextvars
+import random
+import time
+from collections import deque
+from types import SimpleNamespace
+from config import TRACE_SAMPLE_RATE, TRACE_BUFFER_SIZE
+
+# 현재 실행 중인 스팬 (asyncio 작업 생성 시 복사되므로 하위 작업의 스팬도 같은 트레이스에 연결)
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+class NullSpan:
+    """샘플링되지 않은 요청용 스팬 (아무것도 기록하지 않음)"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+    
+    def set(self, **attrs):
+        pass
+
+NULL_SPAN = NullSpan()
+
+class Span:
+    """이름, 속성, 시작/종료 시간, 하위 스팬을 가진 구간"""
+    
+    __slots__ = ("name", "attrs", "start", "end", "children", "parent", "_token")
+    
+    def __init__(self, name, attrs, parent=None):
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.children = []
+        self.start = None
+        self.end = None
+        self._token = None
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        if self.parent is not None:
+            self.parent.children.append(self)
+        self._token = _current_span.set(self)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.perf_counter()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        return False
+    
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+    
+    @property
+    def duration(self):
+        return (self.end or time.perf_counter()) - self.start
+    
+    def to_dict(self, origin):
+        """origin(루트 시작 시간) 기준 밀리초 단위 사전 (끝나지 않은 스팬은 unfinished 표시)"""
+        data = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 2),
+            "duration_ms": round(self.duration * 1000, 2)
+        }
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.end is None:
+            data["unfinished"] = True
+        if self.children:
+            data["children"] = [child.to_dict(origin) for child in self.children]
+        return data
+
+class RootSpan(Span):
+    """트레이스의 최상위 스팬 (종료 시 트레이서 버퍼에 저장)"""
+    
+    __slots__ = ("tracer", "started_at")
+    
+    def __init__(self, tracer, name, attrs):
+        super().__init__(name, attrs)
+        self.tracer = tracer
+        self.started_at = time.time()
+    
+    def __exit__(self, exc_type, exc, tb):
+        super().__exit__(exc_type, exc, tb)
+        self.tracer.traces.append(self)
+        return False
+
+class Tracer:
+    """샘플링된 요청의 스팬 트리를 최근 max_traces개까지 보관"""
+    
+    def __init__(self, sample_rate=TRACE_SAMPLE_RATE, max_traces=TRACE_BUFFER_SIZE):
+        self.sample_rate = sample_rate
+        self.traces = deque(maxlen=max_traces)
+        self.sampled = 0
+    
+    @property
+    def enabled(self):
+        return self.sample_rate > 0
+    
+    def trace(self, name, **attrs):
+        """
+        새 트레이스 시작 (sample_rate 확률로 샘플링)
+        
+        이미 트레이스 안이면 하위 스팬으로 기록
+        """
+        if _current_span.get() is not None:
+            return self.span(name, **attrs)
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return NULL_SPAN
+        
+        self.sampled += 1
+        return RootSpan(self, name, attrs)
+    
+    def span(self, name, **attrs):
+        """현재 트레이스의 하위 스팬 (트레이스 밖이면 NULL_SPAN)"""
+        parent = _current_span.get()
+        if parent is None:
+            return NULL_SPAN
+        return Span(name, attrs, parent)
+    
+    def record(self, name, start, end, **attrs):
+        """이미 끝난 구간을 현재 스팬의 하위 스팬으로 추가 (aiohttp 이벤트용)"""
+        parent = _current_span.get()
+        if parent is None:
+            return
+        
+        span = Span(name, attrs, parent)
+        span.start = start
+        span.end = end
+        parent.children.append(span)
+    
+    def slowest(self, limit=None):
+        """보관 중인 트레이스를 느린 순서로 반환"""
+        traces = sorted(self.traces, key=lambda root: root.duration, reverse=True)
+        return [
+            dict(root.to_dict(root.start), started_at=root.started_at)
+            for root in traces[:limit]
+        ]
+    
+    def stats(self):
+        return {"sample_rate": self.sample_rate, "sampled": self.sampled, "buffered": len(self.traces)}
+    
+    def aiohttp_trace_config(self):
+        """연결 대기, DNS 조회, 연결(TLS 포함) 시간을 현재 스팬에 기록하는 aiohttp TraceConfig"""
+        import aiohttp
+        
+        config = aiohttp.TraceConfig(trace_config_ctx_factory=lambda trace_request_ctx: SimpleNamespace())
+        
+        def phase(name):
+            async def on_start(session, context, params):
+                setattr(context, name, time.perf_counter())
+            
+            async def on_end(session, context, params):
+                start = getattr(context, name, None)
+                if start is not None:
+                    self.record(name, start, time.perf_counter())
+            return on_start, on_end
+        
+        for name, start_signal, end_signal in (
+            ("pool_wait", config.on_connection_queued_start, config.on_connection_queued_end),
+            ("connect", config.on_connection_create_start, config.on_connection_create_end),
+            ("dns", config.on_dns_resolvehost_start, config.on_dns_resolvehost_end)
+        ):
+            on_start, on_end = phase(name)
+            start_signal.append(on_start)
+            end_signal.append(on_end)
+        return config
+
+# 서버 전체가 공유하는 트레이서
+tracer = Tracer()
@@ -0,0 +1,45 @@
+# utils/workers.py
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from config import PARSE_WORKER_MODE, PARSE_WORKERS
+
+# 파싱 작업용 워커 풀 (최초 사용 시 생성)
+_executor = None
+
+def get_executor():
+    """설정에 맞는 워커 풀 반환 ("inline"이면 None)"""
+    global _executor
+    if PARSE_WORKER_MODE == "inline":
+        return None
+    
+    if _executor is None:
+        workers = PARSE_WORKERS or os.cpu_count() or 1
+        if PARSE_WORKER_MODE == "thread":
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parse")
+        else:
+            _executor = ProcessPoolExecutor(max_workers=workers)
+    return _executor
+
+async def run_in_worker(func, *args):
+    """CPU 작업을 워커 풀에서 실행 (인자와 결과는 피클 가능한 값만 사용)"""
+    global _executor
+    executor = get_executor()
+    if executor is None:
+        return func(*args)
+    
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        # 워커 프로세스가 비정상 종료되면 풀을 다시 만들고 이번 작업은 직접 실행
+        _executor = None
+        return func(*args)
+
+def shutdown_workers():
+    """워커 풀 종료"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None